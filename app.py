@@ -3,14 +3,214 @@ Streamlit web interface for Project Cost & Risk Analyzer.
 """
 
 import streamlit as st
-import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
 from src.project import Project, Task
 from src.calculator import ProjectCalculator
-from src.risk_simulator import RiskSimulator
+from src.risk_simulator import RiskSimulator, SimulationResult
 from src.visualizer import ProjectVisualizer
 from src.pdf_generator import PDFReportGenerator
 from src.gantt_chart import GanttChartGenerator
+import hashlib
 import os
+import shutil
+
+# Serialize Plotly figures with orjson when it is available
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# The TBB threading layer can hang interpreter shutdown when parallel kernels
+# are launched from worker threads, which is where Streamlit runs scripts
+try:
+    from numba import config as numba_config
+    numba_config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+except ImportError:
+    pass
+
+
+# Per-run chart directories live here; only the most recent few are kept
+CHART_ROOT = os.path.join("output", "reports", "charts")
+MAX_CHART_DIRS = 16
+
+# Chart keys from ProjectVisualizer.generate_all_charts, in display order
+CHART_CAPTIONS = [
+    ('cost_breakdown', "Cost Breakdown by Task"),
+    ('timeline_comparison', "Timeline Comparison"),
+    ('critical_path', "Critical Path"),
+    ('risk_distribution', "Risk Distribution"),
+    ('scenario_comparison', "Scenario Comparison"),
+]
+
+
+def _task_key(tasks):
+    """Hashable snapshot of the session task list, in insertion order."""
+    return tuple(
+        (t['id'], t['name'], t['days'], t['cost_per_day'], tuple(t['dependencies']))
+        for t in tasks
+    )
+
+
+def _build_project(task_key, team_size, risk_level, project_name=""):
+    """Rebuild a Project from a task key produced by _task_key."""
+    task_objects = [
+        Task(
+            name=name,
+            estimated_days=days,
+            cost_per_day=cost_per_day,
+            task_id=task_id,
+            dependencies=list(dependencies)
+        )
+        for task_id, name, days, cost_per_day, dependencies in task_key
+    ]
+
+    return Project(
+        name=project_name,
+        tasks=task_objects,
+        team_size=team_size,
+        risk_level=risk_level
+    )
+
+
+def _digest(data):
+    """Short hex digest that, unlike hash(), is the same across restarts."""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _fingerprint(task_key, team_size, risk_level):
+    """Single hash of the analysis inputs, used as the cache key for every cached helper."""
+    return _digest(repr((task_key, team_size, risk_level)).encode())
+
+
+def _prune_chart_dirs(keep):
+    """Delete the oldest per-run chart directories beyond MAX_CHART_DIRS, never `keep`."""
+    if not os.path.isdir(CHART_ROOT):
+        return
+    dirs = [entry for entry in os.scandir(CHART_ROOT) if entry.is_dir() and entry.path != keep]
+    dirs.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in dirs[MAX_CHART_DIRS - 1:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+# Cached helpers take the precomputed fingerprint as their key and the
+# Project as an underscore argument, which Streamlit does not hash.
+
+@st.cache_data(show_spinner=False)
+def compute_analysis(fingerprint, _project):
+    """Run the deterministic calculator once per distinct task list."""
+    calculator = ProjectCalculator(_project)
+
+    return {
+        'cost_breakdown': calculator.cost_breakdown,
+        'timeline_breakdown': calculator.calculate_timeline_breakdown(),
+        'task_costs': calculator.calculate_task_costs_frame(),
+        'critical_path_info': calculator.get_critical_path_analysis(),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _run_sim(fingerprint, _project, iterations, seed):
+    """Run the Monte Carlo simulation once per distinct set of inputs."""
+    simulator = RiskSimulator(_project, iterations=iterations, seed=seed)
+    result = simulator.run_simulation()
+
+    return {
+        'costs': result.costs,
+        'timelines': result.timelines,
+        'iterations': result.iterations,
+        'scenarios': result.get_scenarios(),
+        'risk': simulator.analyze_risk_drivers(result),
+    }
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_CHART_DIRS)
+def get_visualizer(fingerprint, project_name, sim_fingerprint, _project):
+    """
+    Shared ProjectVisualizer for a given project and simulation run.
+
+    Each run gets its own chart directory, so re-simulating never
+    overwrites the risk charts that an earlier cached run still points at.
+    Directories from older runs are pruned as new ones are created.
+    """
+    chart_dir = os.path.join(
+        CHART_ROOT, _digest(repr((fingerprint, project_name, sim_fingerprint)).encode())
+    )
+    _prune_chart_dirs(keep=chart_dir)
+    return ProjectVisualizer(_project, output_dir=chart_dir)
+
+
+@st.cache_data(show_spinner=False, max_entries=MAX_CHART_DIRS)
+def _all_charts(fingerprint, project_name, sim_fingerprint, _project, _simulation_result):
+    """Render every chart once per project and simulation run."""
+    visualizer = get_visualizer(fingerprint, project_name, sim_fingerprint, _project)
+    # The directory may have been pruned while the visualizer stayed cached
+    os.makedirs(visualizer.output_dir, exist_ok=True)
+    return visualizer.generate_all_charts(_simulation_result)
+
+
+@st.cache_resource(show_spinner=False)
+def get_pdf_generator(fingerprint, project_name, _project):
+    """Shared PDFReportGenerator for a given project."""
+    return PDFReportGenerator(_project)
+
+
+def _histogram_figure(values, title, xaxis_title, bins=50):
+    """Bar chart of values pre-binned with NumPy, so only the bins are sent to the browser."""
+    counts, edges = np.histogram(values, bins=bins)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+
+    fig = go.Figure(data=[go.Bar(x=centers, y=counts, width=edges[1] - edges[0])])
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="Frequency",
+        showlegend=False,
+        bargap=0
+    )
+    return fig
+
+
+def _add_task():
+    """Form callback: append the submitted task without re-running the analysis."""
+    state = st.session_state
+    task_name = state.new_task_name
+    if not task_name:
+        return
+
+    # Convert dependency names to IDs
+    name_to_id = {t['name']: t['id'] for t in state.tasks}
+    dep_ids = [name_to_id[name] for name in state.new_task_deps if name in name_to_id]
+
+    task_id = task_name.lower().replace(" ", "_")[:20]
+    task = {
+        'name': task_name,
+        'id': task_id,
+        'days': state.new_task_days,
+        'cost_per_day': state.new_task_cost,
+        'dependencies': dep_ids
+    }
+    state.tasks.append(task)
+    state.tasks_by_id[task_id] = task
+    state._dirty = True
+
+
+def _queue_delete(idx):
+    """Delete-button callback: mark a task for removal on the next apply."""
+    st.session_state._pending_del.add(idx)
+    st.session_state._dirty = True
+
+
+def _apply_changes():
+    """Apply queued deletions in one pass and clear the dirty flag."""
+    state = st.session_state
+    if state._pending_del:
+        state.tasks = [t for i, t in enumerate(state.tasks) if i not in state._pending_del]
+        state.tasks_by_id = {t['id']: t for t in state.tasks}
+        state._pending_del = set()
+    state._dirty = False
 
 
 def main():
@@ -32,80 +232,68 @@ def main():
     # Initialize session state for tasks
     if 'tasks' not in st.session_state:
         st.session_state.tasks = []
+    if 'tasks_by_id' not in st.session_state:
+        st.session_state.tasks_by_id = {t['id']: t for t in st.session_state.tasks}
+    if '_pending_del' not in st.session_state:
+        st.session_state._pending_del = set()
+        st.session_state._dirty = False
 
     # Task input form
     with st.sidebar.form("task_form", clear_on_submit=True):
-        task_name = st.text_input("Task Name")
+        st.text_input("Task Name", key="new_task_name")
         col1, col2 = st.columns(2)
         with col1:
-            estimated_days = st.number_input("Days", min_value=0.1, value=5.0, step=0.5)
+            st.number_input("Days", min_value=0.1, value=5.0, step=0.5, key="new_task_days")
         with col2:
-            cost_per_day = st.number_input("$/Day", min_value=1, value=1000, step=100)
+            st.number_input("$/Day", min_value=1, value=1000, step=100, key="new_task_cost")
 
-        dependencies = st.multiselect(
+        st.multiselect(
             "Dependencies",
             options=[t['name'] for t in st.session_state.tasks],
-            help="Select tasks that must be completed before this one"
+            help="Select tasks that must be completed before this one",
+            key="new_task_deps"
         )
 
-        submitted = st.form_submit_button("➕ Add Task")
-
-        if submitted and task_name:
-            # Convert dependency names to IDs
-            dep_ids = []
-            for dep_name in dependencies:
-                for t in st.session_state.tasks:
-                    if t['name'] == dep_name:
-                        dep_ids.append(t['id'])
-                        break
-
-            task_id = task_name.lower().replace(" ", "_")[:20]
-            st.session_state.tasks.append({
-                'name': task_name,
-                'id': task_id,
-                'days': estimated_days,
-                'cost_per_day': cost_per_day,
-                'dependencies': dep_ids
-            })
-            st.rerun()
+        st.form_submit_button("➕ Add Task", on_click=_add_task)
 
     # Display current tasks
     if st.session_state.tasks:
         st.sidebar.markdown("---")
         st.sidebar.subheader("Current Tasks")
+
+        if st.session_state._dirty:
+            st.sidebar.button("✅ Apply changes", type="primary", on_click=_apply_changes,
+                              use_container_width=True)
+
+        tasks_by_id = st.session_state.tasks_by_id
+        pending_del = st.session_state._pending_del
         for idx, task in enumerate(st.session_state.tasks):
             col1, col2 = st.sidebar.columns([4, 1])
             with col1:
                 st.text(f"{task['name']} ({task['days']}d @ ${task['cost_per_day']}/d)")
+                dep_names = [tasks_by_id[d]['name'] for d in task['dependencies'] if d in tasks_by_id]
+                if idx in pending_del:
+                    st.caption("removal pending")
+                elif dep_names:
+                    st.caption(f"after {', '.join(dep_names)}")
             with col2:
-                if st.button("🗑️", key=f"del_{idx}"):
-                    st.session_state.tasks.pop(idx)
-                    st.rerun()
+                if idx not in pending_del:
+                    st.button("🗑️", key=f"del_{idx}", on_click=_queue_delete, args=(idx,))
 
     # Main content area
     if not st.session_state.tasks:
         st.info("👈 Add tasks in the sidebar to begin analysis")
         return
 
+    if st.session_state._dirty:
+        st.info("✏️ Task list changed. Click **Apply changes** in the sidebar to update the analysis.")
+        return
+
     # Create Project object
     try:
-        task_objects = [
-            Task(
-                name=t['name'],
-                estimated_days=t['days'],
-                cost_per_day=t['cost_per_day'],
-                task_id=t['id'],
-                dependencies=t['dependencies']
-            )
-            for t in st.session_state.tasks
-        ]
-
-        project = Project(
-            name=project_name,
-            tasks=task_objects,
-            team_size=team_size,
-            risk_level=risk_level
-        )
+        task_key = _task_key(st.session_state.tasks)
+        project = _build_project(task_key, team_size, risk_level, project_name)
+        fingerprint = _fingerprint(task_key, team_size, risk_level)
 
         # Validate dependencies
         errors = project.validate_dependencies()
@@ -119,9 +307,9 @@ def main():
         with tab1:
             col1, col2, col3 = st.columns(3)
 
-            calculator = ProjectCalculator(project)
-            cost_breakdown = calculator.calculate_cost_breakdown()
-            timeline_breakdown = calculator.calculate_timeline_breakdown()
+            analysis = compute_analysis(fingerprint, project)
+            cost_breakdown = analysis['cost_breakdown']
+            timeline_breakdown = analysis['timeline_breakdown']
 
             with col1:
                 st.metric("Total Tasks", project.task_count)
@@ -140,14 +328,15 @@ def main():
 
             # Task table
             st.subheader("Task Breakdown")
-            task_costs = calculator.calculate_task_costs()
-            df = pd.DataFrame(task_costs)
-            df = df[['task_name', 'days', 'cost_per_day', 'base_cost', 'adjusted_cost']]
+            df = analysis['task_costs'][['task_name', 'days', 'cost_per_day', 'base_cost', 'adjusted_cost']]
             df.columns = ['Task', 'Days', '$/Day', 'Base Cost', 'Adjusted Cost']
-            df['Base Cost'] = df['Base Cost'].apply(lambda x: f"${x:,.0f}")
-            df['Adjusted Cost'] = df['Adjusted Cost'].apply(lambda x: f"${x:,.0f}")
-            df['$/Day'] = df['$/Day'].apply(lambda x: f"${x:,.0f}")
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            money = st.column_config.NumberColumn(format="dollar")
+            st.dataframe(
+                df,
+                column_config={'$/Day': money, 'Base Cost': money, 'Adjusted Cost': money},
+                use_container_width=True,
+                hide_index=True
+            )
 
         # TAB 2: Detailed Analysis
         with tab2:
@@ -167,7 +356,7 @@ def main():
                 st.write(f"- **Realistic: {timeline_breakdown['parallel_realistic']:.1f} days**")
 
             # Critical Path
-            critical_path_info = calculator.get_critical_path_analysis()
+            critical_path_info = analysis['critical_path_info']
             if critical_path_info['exists']:
                 st.subheader("Critical Path Analysis")
                 st.write(f"**Tasks in Critical Path:** {critical_path_info['task_count']}")
@@ -180,23 +369,31 @@ def main():
         with tab3:
             st.subheader("Monte Carlo Risk Simulation")
 
-            iterations = st.slider("Number of Simulations", 100, 5000, 1000, 100)
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                iterations = st.slider("Number of Simulations", 100, 5000, 1000, 100)
+            with col2:
+                seed = st.number_input("Random Seed", min_value=0, value=42, step=1,
+                                       help="Same seed and inputs reproduce the same results")
 
             if st.button("🎲 Run Simulation", type="primary"):
                 with st.spinner(f"Running {iterations:,} simulations..."):
-                    simulator = RiskSimulator(project, iterations=iterations)
-                    result = simulator.run_simulation()
+                    sim = _run_sim(fingerprint, project, iterations, seed)
 
                     # Store in session state
-                    st.session_state.simulation_result = result
-                    st.session_state.simulator = simulator
+                    st.session_state.simulation = sim
+                    st.session_state.simulation_result = SimulationResult(
+                        costs=sim['costs'],
+                        timelines=sim['timelines'],
+                        iterations=sim['iterations']
+                    )
+                    st.session_state.simulator = RiskSimulator(project, iterations=iterations, seed=seed)
 
                 st.success("✅ Simulation complete!")
 
-            if 'simulation_result' in st.session_state:
-                result = st.session_state.simulation_result
-                simulator = st.session_state.simulator
-                scenarios = result.get_scenarios()
+            if 'simulation' in st.session_state:
+                sim = st.session_state.simulation
+                scenarios = sim['scenarios']
 
                 # Display scenarios
                 col1, col2, col3, col4 = st.columns(4)
@@ -223,7 +420,7 @@ def main():
 
                 # Risk Analysis
                 st.subheader("Risk Analysis")
-                risk_analysis = simulator.analyze_risk_drivers(result)
+                risk_analysis = sim['risk']
 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -240,25 +437,16 @@ def main():
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    import plotly.graph_objects as go
-                    fig = go.Figure(data=[go.Histogram(x=result.costs, nbinsx=50)])
-                    fig.update_layout(
-                        title="Cost Distribution",
-                        xaxis_title="Cost ($)",
-                        yaxis_title="Frequency",
-                        showlegend=False
+                    st.plotly_chart(
+                        _histogram_figure(sim['costs'], "Cost Distribution", "Cost ($)"),
+                        use_container_width=True
                     )
-                    st.plotly_chart(fig, use_container_width=True)
 
                 with col2:
-                    fig = go.Figure(data=[go.Histogram(x=result.timelines, nbinsx=50)])
-                    fig.update_layout(
-                        title="Timeline Distribution",
-                        xaxis_title="Days",
-                        yaxis_title="Frequency",
-                        showlegend=False
+                    st.plotly_chart(
+                        _histogram_figure(sim['timelines'], "Timeline Distribution", "Days"),
+                        use_container_width=True
                     )
-                    st.plotly_chart(fig, use_container_width=True)
 
                 # TAB 4: Charts & Reports
                 with tab4:
@@ -269,10 +457,14 @@ def main():
 
                         if st.button("Generate All Charts", type="primary", key="gen_charts"):
                             with st.spinner("Generating charts..."):
-                                visualizer = ProjectVisualizer(project)
-
                                 simulation_result = st.session_state.get('simulation_result', None)
-                                charts = visualizer.generate_all_charts(simulation_result)
+                                sim_fingerprint = (
+                                    _digest(simulation_result.costs.tobytes()) if simulation_result else None
+                                )
+                                charts = _all_charts(
+                                    fingerprint, project_name, sim_fingerprint,
+                                    project, simulation_result
+                                )
 
                                 st.session_state.charts = charts
 
@@ -281,22 +473,18 @@ def main():
                         if 'charts' in st.session_state:
                             charts = st.session_state.charts
 
-                            # Display charts
-                            if 'cost_breakdown' in charts and os.path.exists(charts['cost_breakdown']):
-                                st.image(charts['cost_breakdown'], caption="Cost Breakdown by Task")
-
-                            if 'timeline_comparison' in charts and os.path.exists(charts['timeline_comparison']):
-                                st.image(charts['timeline_comparison'], caption="Timeline Comparison")
-
-                            if 'critical_path' in charts and charts['critical_path'] and os.path.exists(
-                                    charts['critical_path']):
-                                st.image(charts['critical_path'], caption="Critical Path")
-
-                            if 'risk_distribution' in charts and os.path.exists(charts['risk_distribution']):
-                                st.image(charts['risk_distribution'], caption="Risk Distribution")
+                            # Display charts; one directory listing instead of a stat per chart
+                            chart_paths = [path for path in charts.values() if path]
+                            chart_dir = os.path.dirname(chart_paths[0]) if chart_paths else None
+                            existing = (
+                                {entry.name for entry in os.scandir(chart_dir)}
+                                if chart_dir and os.path.isdir(chart_dir) else set()
+                            )
 
-                            if 'scenario_comparison' in charts and os.path.exists(charts['scenario_comparison']):
-                                st.image(charts['scenario_comparison'], caption="Scenario Comparison")
+                            for key, caption in CHART_CAPTIONS:
+                                path = charts.get(key)
+                                if path and os.path.basename(path) in existing:
+                                    st.image(path, caption=caption)
 
                     with col2:
                         st.subheader("📅 Gantt Chart")
@@ -319,7 +507,7 @@ def main():
 
                     if st.button("📥 Generate PDF Report", type="primary", key="gen_pdf"):
                         with st.spinner("Generating PDF report..."):
-                            pdf_gen = PDFReportGenerator(project)
+                            pdf_gen = get_pdf_generator(fingerprint, project_name, project)
 
                             simulation_result = st.session_state.get('simulation_result', None)
                             simulator = st.session_state.get('simulator', None)
@@ -332,23 +520,28 @@ def main():
                             )
 
                             st.session_state.pdf_path = pdf_path
+                            with open(pdf_path, 'rb') as pdf_file:
+                                st.session_state.pdf_bytes = pdf_file.read()
 
                         st.success(f"✅ PDF report generated!")
 
-                    if 'pdf_path' in st.session_state:
-                        with open(st.session_state.pdf_path, 'rb') as pdf_file:
-                            st.download_button(
-                                label="📥 Download PDF Report",
-                                data=pdf_file,
-                                file_name=os.path.basename(st.session_state.pdf_path),
-                                mime='application/pdf',
-                                type="primary"
-                            )
-
+                    if 'pdf_bytes' in st.session_state:
+                        st.download_button(
+                            label="📥 Download PDF Report",
+                            data=st.session_state.pdf_bytes,
+                            file_name=os.path.basename(st.session_state.pdf_path),
+                            mime='application/pdf',
+                            type="primary"
+                        )
+
+    except (ValueError, KeyError) as e:
+        # Expected while the task list is mid-edit; no traceback needed
+        st.warning(f"Could not analyze the project: {e}")
     except Exception as e:
         st.error(f"Error: {e}")
-        import traceback
-        st.code(traceback.format_exc())
+        with st.expander("Show details"):
+            import traceback
+            st.code(traceback.format_exc())
 
 
 if __name__ == "__main__":
@@ -2,9 +2,9 @@
 Main entry point for the Project Cost & Risk Analyzer.
 """
 
-import csv
 import os
 from datetime import datetime
+import pandas as pd
 from src.project import Project, Task
 from src.calculator import ProjectCalculator
 from src.risk_simulator import RiskSimulator
@@ -19,6 +19,16 @@ from src.utils import (
     save_text_report
 )
 
+# Set ANALYZER_NONINTERACTIVE to 1, true or yes to skip the "Press Enter" pauses, e.g. when
+# project details are piped in on stdin
+NONINTERACTIVE = os.environ.get('ANALYZER_NONINTERACTIVE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def pause(prompt: str) -> None:
+    """Wait for Enter, unless running non-interactively."""
+    if not NONINTERACTIVE:
+        input(prompt)
+
 
 def get_user_input():
     """
@@ -145,9 +155,9 @@ def display_basic_analysis(project: Project, calculator: ProjectCalculator):
     print_key_value("Name", project.name)
     print_key_value("Tasks", str(project.task_count))
     print_key_value("Team Size", str(project.team_size))
-    print_key_value("Risk Level", project.risk_level.capitalize())
+    print_key_value("Risk Level", project.risk_level_display)
 
-    cost_breakdown = calculator.calculate_cost_breakdown()
+    cost_breakdown = calculator.cost_breakdown
     print("\nCost Analysis:")
     print_key_value("Base Cost", format_currency(cost_breakdown['base_cost']))
     print_key_value("Risk Overhead", format_currency(cost_breakdown['risk_overhead']))
@@ -176,6 +186,9 @@ def run_monte_carlo_simulation(project: Project):
     print_section_header("MONTE CARLO RISK SIMULATION")
 
     while True:
+        if NONINTERACTIVE:
+            iterations = 1000
+            break
         try:
             iterations_input = input("\nEnter number of simulations (default 1000, min 100): ").strip()
             if not iterations_input:
@@ -234,38 +247,44 @@ def save_reports(project: Project, calculator: ProjectCalculator, simulation_res
 
     os.makedirs("output/reports", exist_ok=True)
 
+    cost_breakdown = calculator.cost_breakdown
+    timeline_breakdown = calculator.calculate_timeline_breakdown()
+
+    # Each section is a small DataFrame; numbers stay numeric so the file re-parses
+    sections = [
+        ("PROJECT ANALYSIS REPORT", pd.DataFrame({
+            'Field': ["Generated"],
+            'Value': [datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+        })),
+        ("PROJECT INFORMATION", pd.DataFrame({
+            'Field': ["Name", "Tasks", "Team Size", "Risk Level"],
+            'Value': [project.name, project.task_count, project.team_size, project.risk_level_display]
+        })),
+        ("COST ANALYSIS", pd.DataFrame({
+            'Field': ["Base Cost", "Total Cost"],
+            'Cost ($)': [cost_breakdown['base_cost'], cost_breakdown['total_cost']]
+        })),
+        ("TIMELINE ANALYSIS", pd.DataFrame({
+            'Field': ["Sequential", "Realistic"],
+            'Days': [timeline_breakdown['sequential'], timeline_breakdown['parallel_realistic']]
+        })),
+        ("TASKS", calculator.calculate_task_costs_frame()),
+    ]
+
+    if simulation_result:
+        scenarios = simulation_result.get_scenarios()
+        keys = ['best_case', 'expected', 'worst_case']
+        sections.append(("SIMULATION RESULTS", pd.DataFrame({
+            'Scenario': ["Best Case", "Expected", "Worst Case"],
+            'Cost ($)': [scenarios[key]['cost'] for key in keys],
+            'Timeline (days)': [scenarios[key]['timeline'] for key in keys]
+        })))
+
     with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        writer.writerow(["PROJECT ANALYSIS REPORT"])
-        writer.writerow(["Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-        writer.writerow([])
-
-        writer.writerow(["PROJECT INFORMATION"])
-        writer.writerow(["Name", project.name])
-        writer.writerow(["Tasks", project.task_count])
-        writer.writerow(["Team Size", project.team_size])
-        writer.writerow(["Risk Level", project.risk_level.capitalize()])
-        writer.writerow([])
-
-        cost_breakdown = calculator.calculate_cost_breakdown()
-        writer.writerow(["COST ANALYSIS"])
-        writer.writerow(["Base Cost", f"${cost_breakdown['base_cost']:,.2f}"])
-        writer.writerow(["Total Cost", f"${cost_breakdown['total_cost']:,.2f}"])
-        writer.writerow([])
-
-        timeline_breakdown = calculator.calculate_timeline_breakdown()
-        writer.writerow(["TIMELINE ANALYSIS"])
-        writer.writerow(["Sequential", f"{timeline_breakdown['sequential']:.1f} days"])
-        writer.writerow(["Realistic", f"{timeline_breakdown['parallel_realistic']:.1f} days"])
-        writer.writerow([])
-
-        if simulation_result:
-            scenarios = simulation_result.get_scenarios()
-            writer.writerow(["SIMULATION RESULTS"])
-            writer.writerow(["Best Case", f"${scenarios['best_case']['cost']:,.2f}", f"{scenarios['best_case']['timeline']:.1f} days"])
-            writer.writerow(["Expected", f"${scenarios['expected']['cost']:,.2f}", f"{scenarios['expected']['timeline']:.1f} days"])
-            writer.writerow(["Worst Case", f"${scenarios['worst_case']['cost']:,.2f}", f"{scenarios['worst_case']['timeline']:.1f} days"])
+        for name, frame in sections:
+            csvfile.write(f"{name}\n")
+            frame.to_csv(csvfile, index=False, float_format='%.2f')
+            csvfile.write("\n")
 
     print(f"✓ CSV report saved: {csv_path}")
 
@@ -292,18 +311,18 @@ def main():
 
         # AUTOMATICALLY run simulation (no prompt)
         print("\n")
-        input("Press Enter to run Monte Carlo simulation...")
+        pause("Press Enter to run Monte Carlo simulation...")
         simulation_result, simulator = run_monte_carlo_simulation(project)
 
         # AUTOMATICALLY generate charts (no prompt)
         print("\n")
-        input("Press Enter to generate visualization charts...")
+        pause("Press Enter to generate visualization charts...")
         visualizer = ProjectVisualizer(project)
         charts = visualizer.generate_all_charts(simulation_result)
 
         # AUTOMATICALLY save reports (no prompt)
         print("\n")
-        input("Press Enter to save analysis reports...")
+        pause("Press Enter to save analysis reports...")
         save_reports(project, calculator, simulation_result, simulator)
 
         # Final message
@@ -320,4 +339,11 @@ def main():
 
 
 if __name__ == "__main__":
+    # Prefer OpenMP over TBB for the parallel kernels; TBB can hang shutdown
+    try:
+        from numba import config as numba_config
+        numba_config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+    except ImportError:
+        pass
+
     main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Compiled kernels for the Monte Carlo simulator.
+
+Numba is optional. When it is not installed NUMBA_AVAILABLE is False and
+the simulator uses its NumPy implementation instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def cp_batch(durations, topo, pred_indptr, pred_idx):
+    """
+    Longest dependency path for every simulated scenario.
+
+    Args:
+        durations: Task durations, shape (iterations, tasks)
+        topo: Indices of the tasks to schedule, in topological order;
+            columns not listed are ignored
+        pred_indptr: CSR offsets into pred_idx, one slot per task plus one
+        pred_idx: Predecessor task indices
+
+    Returns:
+        Array of project durations, one per scenario, in the dtype
+        of durations
+    """
+    iterations, n_tasks = durations.shape
+    n_scheduled = topo.shape[0]
+    timelines = np.empty(iterations, dtype=durations.dtype)
+
+    for p in prange(iterations):
+        finish = np.empty(n_tasks, dtype=durations.dtype)
+        longest = 0.0
+
+        for i in range(n_scheduled):
+            v = topo[i]
+            start = 0.0
+            for k in range(pred_indptr[v], pred_indptr[v + 1]):
+                pred_finish = finish[pred_idx[k]]
+                if pred_finish > start:
+                    start = pred_finish
+
+            finish[v] = start + durations[p, v]
+            if finish[v] > longest:
+                longest = finish[v]
+
+        timelines[p] = longest
+
+    return timelines
@@ -0,0 +1,67 @@
+"""
+Compiled kernel for the resource-constrained scheduler.
+
+Numba is optional. When it is not installed NUMBA_AVAILABLE is False and
+the calculator keeps its pure-Python scheduler instead.
+"""
+
+import heapq
+
+from src._mc_kernel import NUMBA_AVAILABLE, njit  # noqa: F401  (re-exported for callers)
+
+
+@njit(cache=True)
+def simulate_schedule(durations, earliest_start, in_degree, succ_indptr, succ_idx, team_size):
+    """
+    Event-driven list scheduling with a limited team.
+
+    Ready tasks are taken in order of (earliest start, longest duration,
+    task index); running tasks finish in order of finish time.
+
+    Args:
+        durations: Task durations in days
+        earliest_start: Dependency-only start day per task
+        in_degree: Number of predecessors per task (consumed in place)
+        succ_indptr: CSR offsets into succ_idx, one slot per task plus one
+        succ_idx: Successor task indices
+        team_size: Number of tasks that can run at once
+
+    Returns:
+        Finish time of the last task
+    """
+    n_tasks = durations.shape[0]
+
+    # Seed the lists so Numba can type them, then empty them
+    ready = [(0.0, 0.0, 0.0)]
+    ready.pop()
+    active = [(0.0, 0.0)]
+    active.pop()
+
+    for i in range(n_tasks):
+        if in_degree[i] == 0:
+            ready.append((earliest_start[i], -durations[i], float(i)))
+    heapq.heapify(ready)
+
+    current_time = 0.0
+    project_finish = 0.0
+
+    while len(ready) > 0 or len(active) > 0:
+        # Start ready tasks while team members are free
+        while len(ready) > 0 and len(active) < team_size:
+            i = int(heapq.heappop(ready)[2])
+            finish = current_time + durations[i]
+            heapq.heappush(active, (finish, float(i)))
+            if finish > project_finish:
+                project_finish = finish
+
+        # Advance to the next completion and release every task finishing then
+        current_time = active[0][0]
+        while len(active) > 0 and active[0][0] <= current_time:
+            i = int(heapq.heappop(active)[1])
+            for k in range(succ_indptr[i], succ_indptr[i + 1]):
+                succ = succ_idx[k]
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    heapq.heappush(ready, (earliest_start[succ], -durations[succ], float(succ)))
+
+    return project_finish
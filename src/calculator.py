@@ -2,14 +2,30 @@
 Calculator for project cost and timeline estimation.
 """
 
+import heapq
+from functools import cached_property
+from operator import attrgetter
+import numpy as np
+import pandas as pd
 from typing import Dict, List, Tuple
 from src.project import Project, Task
 from src.utils import get_risk_multiplier, validate_positive_number
+from src._schedule_kernel import NUMBA_AVAILABLE, simulate_schedule
+
+# Below this many tasks the Python scheduler is faster than loading the compiled one
+SCHEDULE_KERNEL_MIN_TASKS = 200
+
+_DAYS = attrgetter('estimated_days')
+_BASE_COST = attrgetter('base_cost')
 
 
 class ProjectCalculator:
     """
     Handles cost and timeline calculations for projects.
+
+    The project is treated as fixed for the calculator's lifetime: its total
+    cost, critical path and cost breakdown are computed once and reused by
+    every method. Call refresh() after changing the project.
     """
 
     def __init__(self, project: Project):
@@ -22,6 +38,34 @@ class ProjectCalculator:
         self.project = project
         self.risk_multiplier = get_risk_multiplier(project.risk_level)
 
+    def refresh(self) -> None:
+        """Drop cached results, and the project's own caches, after the project has been changed."""
+        self.project.invalidate_cache()
+        self.risk_multiplier = get_risk_multiplier(self.project.risk_level)
+        for name in ('_total_base_cost', '_critical_path', '_critical_path_duration', '_task_arrays', 'cost_breakdown'):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _total_base_cost(self) -> float:
+        """Project base cost, as summed by the project from its task cost column."""
+        return self.project.total_base_cost
+
+    @cached_property
+    def _critical_path(self) -> List[Task]:
+        """Critical path tasks, computed once."""
+        tasks = self.project.tasks
+
+        # A lone task is the whole path unless it depends on itself
+        if len(tasks) == 1 and tasks[0].task_id not in tasks[0].dependencies:
+            return list(tasks)
+
+        return self.project.get_critical_path()
+
+    @cached_property
+    def _critical_path_duration(self) -> float:
+        """Total estimated days along the critical path."""
+        return sum(map(_DAYS, self._critical_path))
+
     def calculate_base_cost(self) -> float:
         """
         Calculate the total base cost (no risk adjustment).
@@ -29,7 +73,7 @@ class ProjectCalculator:
         Returns:
             Total base cost
         """
-        return self.project.total_base_cost
+        return self._total_base_cost
 
     def calculate_adjusted_cost(self) -> float:
         """
@@ -38,7 +82,7 @@ class ProjectCalculator:
         Returns:
             Risk-adjusted total cost
         """
-        return self.project.total_base_cost * self.risk_multiplier
+        return self._total_base_cost * self.risk_multiplier
 
     def calculate_cost_per_resource(self) -> float:
         """
@@ -70,9 +114,14 @@ class ProjectCalculator:
         if not self.project.tasks:
             return 0.0
 
+        # A lone task is its own schedule and critical path, with the same
+        # self-dependency guard as _critical_path
+        tasks = self.project.tasks
+        if len(tasks) == 1 and tasks[0].task_id not in tasks[0].dependencies:
+            return tasks[0].estimated_days * self.risk_multiplier
+
         # Get critical path duration (minimum possible timeline)
-        critical_path = self.project.get_critical_path()
-        critical_path_duration = sum(task.estimated_days for task in critical_path)
+        critical_path_duration = self._critical_path_duration
 
         # Calculate resource-constrained timeline
         # This simulates task scheduling with limited team members
@@ -90,89 +139,119 @@ class ProjectCalculator:
         """
         Simulate project execution with resource constraints.
 
+        Event-driven list scheduling: tasks whose dependencies are done wait
+        in a heap ordered by dependency-based earliest start (longest task
+        first on ties), and running tasks sit in a heap keyed on finish
+        time, so each task is pushed and popped once.
+
         Returns:
             Estimated duration considering resource availability
         """
-        # Track when each task can start and finish
-        task_start_times = {}
-        task_finish_times = {}
-
-        # Track available team members over time
-        team_availability = {0: self.project.team_size}
-
-        # Build dependency completion times
-        for task in self.project.tasks:
-            # Earliest this task can start based on dependencies
-            earliest_start = 0.0
-            for dep_id in task.dependencies:
-                if dep_id in task_finish_times:
-                    earliest_start = max(earliest_start, task_finish_times[dep_id])
-
-            task_start_times[task.task_id] = earliest_start
-            task_finish_times[task.task_id] = earliest_start + task.estimated_days
+        team_size = self.project.team_size
+        graph = self.project._graph
+        order = graph.schedule_order
+        topo_tasks = self.project.topological_tasks
+        id_to_task = graph.id_to_task
+        earliest_start = graph.earliest_start
 
         # If we have enough resources for all tasks, use dependency-based timeline
-        if self.project.team_size >= self.project.task_count:
-            return max(task_finish_times.values()) if task_finish_times else 0.0
-
-        # Otherwise, simulate resource contention
-        # Sort tasks by earliest start time
-        sorted_tasks = sorted(
-            self.project.tasks,
-            key=lambda t: (task_start_times[t.task_id], -t.estimated_days)
-        )
-
-        # Reschedule considering resource limits
-        scheduled_start = {}
-        scheduled_finish = {}
-        active_tasks = []
+        if team_size >= self.project.task_count:
+            return max(
+                (earliest_start[task.task_id] + task.estimated_days for task in topo_tasks),
+                default=0.0
+            )
+
+        # Otherwise, simulate resource contention on the project's cached graph
+        successors = graph.succ
+        in_degree = dict(graph.indeg)
+
+        # Tasks caught in a cycle follow the rest of the order; only edges
+        # from earlier in the order count, so a cycle cannot stall the schedule
+        if len(graph.topo_order) < len(order):
+            position = {task_id: pos for pos, task_id in enumerate(order)}
+            successors = {
+                task_id: tuple(succ_id for succ_id in succ_ids if position[succ_id] > position[task_id])
+                for task_id, succ_ids in successors.items()
+            }
+            in_degree = dict.fromkeys(order, 0)
+            for succ_ids in successors.values():
+                for succ_id in succ_ids:
+                    in_degree[succ_id] += 1
+
+        # Ties fall back to project order
+        project_index = {task_id: i for i, task_id in enumerate(id_to_task)}
+
+        if NUMBA_AVAILABLE and len(order) >= SCHEDULE_KERNEL_MIN_TASKS:
+            return self._run_schedule_kernel(order, id_to_task, earliest_start, successors, in_degree, project_index)
+
+        def ready_entry(task_id: str) -> Tuple[float, float, int, str]:
+            return (
+                earliest_start[task_id],
+                -id_to_task[task_id].estimated_days,
+                project_index[task_id],
+                task_id
+            )
+
+        # Bind hot-loop lookups to locals
+        heappush, heappop = heapq.heappush, heapq.heappop
+        durations = {task_id: task.estimated_days for task_id, task in id_to_task.items()}
+
+        ready = [ready_entry(task_id) for task_id in order if in_degree[task_id] == 0]
+        heapq.heapify(ready)
+        active = []
         current_time = 0.0
-        remaining_tasks = sorted_tasks.copy()
-
-        while remaining_tasks or active_tasks:
-            # Complete any finished tasks
-            active_tasks = [
-                t for t in active_tasks
-                if scheduled_finish[t.task_id] > current_time
-            ]
-
-            # Try to start new tasks
-            can_start = []
-            for task in remaining_tasks:
-                # Check if dependencies are complete
-                deps_complete = all(
-                    dep_id in scheduled_finish and scheduled_finish[dep_id] <= current_time
-                    for dep_id in task.dependencies
-                )
-
-                if deps_complete and len(active_tasks) < self.project.team_size:
-                    can_start.append(task)
-
-            # Start tasks
-            for task in can_start:
-                scheduled_start[task.task_id] = current_time
-                scheduled_finish[task.task_id] = current_time + task.estimated_days
-                active_tasks.append(task)
-                remaining_tasks.remove(task)
-
-            # Advance time to next event (task completion or all tasks scheduled)
-            if active_tasks:
-                next_finish = min(scheduled_finish[t.task_id] for t in active_tasks)
-                current_time = next_finish
-            elif remaining_tasks:
-                # Jump to when next task can start
-                next_task = remaining_tasks[0]
-                if next_task.dependencies:
-                    current_time = max(
-                        scheduled_finish.get(dep_id, 0)
-                        for dep_id in next_task.dependencies
-                    )
-                else:
-                    current_time += 0.1  # Small increment to avoid infinite loop
-            else:
-                break
-
-        return max(scheduled_finish.values()) if scheduled_finish else 0.0
+        project_finish = 0.0
+
+        while ready or active:
+            # Start ready tasks while team members are free
+            while ready and len(active) < team_size:
+                task_id = heappop(ready)[-1]
+                finish = current_time + durations[task_id]
+                heappush(active, (finish, task_id))
+                if finish > project_finish:
+                    project_finish = finish
+
+            # Advance to the next completion and release every task finishing then
+            current_time = active[0][0]
+            while active and active[0][0] <= current_time:
+                _, task_id = heappop(active)
+                for succ_id in successors[task_id]:
+                    in_degree[succ_id] -= 1
+                    if in_degree[succ_id] == 0:
+                        heappush(ready, ready_entry(succ_id))
+
+        return project_finish
+
+    def _run_schedule_kernel(
+            self,
+            order: Tuple[str, ...],
+            id_to_task: Dict[str, Task],
+            earliest_start: Dict[str, float],
+            successors: Dict[str, Tuple[str, ...]],
+            in_degree: Dict[str, int],
+            project_index: Dict[str, int]
+    ) -> float:
+        """
+        Run the compiled scheduler on flat arrays indexed by project order.
+
+        Returns:
+            Estimated duration considering resource availability
+        """
+        task_ids = list(project_index)
+        durations = np.array([id_to_task[task_id].estimated_days for task_id in task_ids], dtype=np.float64)
+        starts = np.array([earliest_start[task_id] for task_id in task_ids], dtype=np.float64)
+        degrees = np.array([in_degree[task_id] for task_id in task_ids], dtype=np.int64)
+
+        succ_indptr = np.zeros(len(task_ids) + 1, dtype=np.int64)
+        succ_idx = []
+        for i, task_id in enumerate(task_ids):
+            succ_idx.extend(project_index[succ_id] for succ_id in successors[task_id])
+            succ_indptr[i + 1] = len(succ_idx)
+
+        return float(simulate_schedule(
+            durations, starts, degrees, succ_indptr,
+            np.array(succ_idx, dtype=np.int64), self.project.team_size
+        ))
 
     def calculate_timeline_breakdown(self) -> Dict[str, float]:
         """
@@ -183,13 +262,17 @@ class ProjectCalculator:
         """
         return {
             'sequential': self.calculate_sequential_timeline(),
-            'parallel_optimistic': sum(task.estimated_days for task in self.project.get_critical_path()),
+            'parallel_optimistic': self._critical_path_duration,
             'parallel_realistic': self.calculate_parallel_timeline(),
         }
 
-    def calculate_cost_breakdown(self) -> Dict[str, float]:
+    @cached_property
+    def cost_breakdown(self) -> Dict[str, float]:
         """
-        Get a detailed cost breakdown.
+        Detailed cost breakdown, computed once.
+
+        Treat the returned dictionary as read-only; it is shared by every
+        caller.
 
         Returns:
             Dictionary with cost components
@@ -205,6 +288,30 @@ class ProjectCalculator:
             'cost_per_resource': self.calculate_cost_per_resource(),
         }
 
+    def calculate_cost_breakdown(self) -> Dict[str, float]:
+        """
+        Get a detailed cost breakdown.
+
+        Returns:
+            Copy of the cached cost breakdown, safe to modify
+        """
+        return dict(self.cost_breakdown)
+
+    @cached_property
+    def _task_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-task cost columns as NumPy arrays; only the risk adjustment is computed here.
+
+        Returns:
+            Tuple of (days, cost_per_day, base_cost, adjusted_cost) arrays
+        """
+        days = self.project._est_days_arr
+        rates = self.project._cost_per_day_arr
+        base = self.project._base_cost_arr
+        adjusted = base * self.risk_multiplier
+
+        return days, rates, base, adjusted
+
     def calculate_task_costs(self) -> List[Dict[str, any]]:
         """
         Calculate cost for each individual task.
@@ -212,22 +319,39 @@ class ProjectCalculator:
         Returns:
             List of dictionaries with task cost details
         """
-        task_costs = []
-
-        for task in self.project.tasks:
-            base = task.base_cost
-            adjusted = base * self.risk_multiplier
+        days, rates, base, adjusted = self._task_arrays
 
-            task_costs.append({
+        return [
+            {
                 'task_name': task.name,
                 'task_id': task.task_id,
-                'base_cost': base,
-                'adjusted_cost': adjusted,
-                'days': task.estimated_days,
-                'cost_per_day': task.cost_per_day,
-            })
+                'base_cost': base_cost,
+                'adjusted_cost': adjusted_cost,
+                'days': task_days,
+                'cost_per_day': cost_per_day,
+            }
+            for task, base_cost, adjusted_cost, task_days, cost_per_day in zip(
+                self.project.tasks, base.tolist(), adjusted.tolist(), days.tolist(), rates.tolist()
+            )
+        ]
+
+    def calculate_task_costs_frame(self) -> pd.DataFrame:
+        """
+        Calculate cost for each individual task as a DataFrame.
+
+        Returns:
+            DataFrame with one row per task
+        """
+        days, rates, base, adjusted = self._task_arrays
 
-        return task_costs
+        return pd.DataFrame({
+            'task_name': [task.name for task in self.project.tasks],
+            'task_id': [task.task_id for task in self.project.tasks],
+            'days': days,
+            'cost_per_day': rates,
+            'base_cost': base,
+            'adjusted_cost': adjusted,
+        })
 
     def get_critical_path_analysis(self) -> Dict[str, any]:
         """
@@ -236,7 +360,7 @@ class ProjectCalculator:
         Returns:
             Dictionary with critical path information
         """
-        critical_path = self.project.get_critical_path()
+        critical_path = self._critical_path
 
         if not critical_path:
             return {
@@ -246,8 +370,8 @@ class ProjectCalculator:
                 'cost': 0.0,
             }
 
-        duration = sum(task.estimated_days for task in critical_path)
-        cost = sum(task.base_cost for task in critical_path)
+        duration = self._critical_path_duration
+        cost = sum(map(_BASE_COST, critical_path))
 
         return {
             'exists': True,
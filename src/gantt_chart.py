@@ -2,121 +2,238 @@
 Gantt chart generator for project timeline visualization.
 """
 
+import matplotlib.dates as mdates
+import matplotlib.patches as mpatches
+import numpy as np
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-from typing import Dict
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import plotly.io as pio
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+import gzip
 import os
+import threading
 
 from src.project import Project
 from src.calculator import ProjectCalculator
 
 
+# Figure dicts of recently built charts with their (first start, last end)
+# dates, keyed on (project fingerprint, start date). Streamlit runs scripts
+# on several threads, so every read and write goes through the lock.
+_FIGURE_CACHE: "OrderedDict[Tuple[int, str], Tuple[dict, Optional[Tuple[datetime, datetime]]]]" = OrderedDict()
+_FIGURE_CACHE_SIZE = 32
+_FIGURE_CACHE_LOCK = threading.Lock()
+
+_US_PER_DAY = 86_400_000_000
+
+# Static Gantt styling, validated once at import and layered on the default template
+_GANTT_TEMPLATE = go.layout.Template(pio.templates[pio.templates.default])
+_GANTT_TEMPLATE.layout.update(
+    title=dict(
+        x=0.5,
+        xanchor='center',
+        font=dict(size=24, color='#000000', family='Arial Black')
+    ),
+    xaxis=dict(
+        title=dict(text='<b>Date</b>', font=dict(size=16, color='#000000')),
+        gridcolor='#D0D0D0',
+        showgrid=True,
+        linecolor='#000000',
+        linewidth=2,
+        tickfont=dict(size=12, color='#000000')
+    ),
+    yaxis=dict(
+        title=dict(text='<b>Tasks</b>', font=dict(size=16, color='#000000')),
+        gridcolor='#D0D0D0',
+        showgrid=True,
+        linecolor='#000000',
+        linewidth=2,
+        tickfont=dict(size=14, color='#000000', family='Arial'),
+        categoryorder='array'
+    ),
+    plot_bgcolor='#FFFFFF',
+    paper_bgcolor='#F5F5F5',
+    hovermode='closest',
+    margin=dict(l=250, r=120, t=120, b=100),
+    bargap=0.2,
+    barmode='overlay',
+    legend=dict(
+        x=1.02, y=1, xanchor='left', yanchor='top',
+        bgcolor='white',
+        bordercolor='#000000', borderwidth=2,
+        font=dict(size=13, color='#000000')
+    )
+)
+
+
+# Hover text for one task bar, filled with a single str.format call
+_HOVER_TMPL = (
+    '<b>{name}</b><br>'
+    'Start: {start:%b %d, %Y}<br>'
+    'End: {end:%b %d, %Y}<br>'
+    'Duration: {days:.1f} days<br>'
+    'Cost: ${cost:,.2f}<br>'
+    '{critical}'
+)
+_CRITICAL_LABEL = '<b>⚠ CRITICAL PATH</b><br>'
+
+
+def _project_fingerprint(project: Project) -> int:
+    """Hash of everything about a project that shows up in its Gantt chart."""
+    return hash((
+        project.name,
+        tuple(
+            (t.task_id, t.name, t.estimated_days, t.base_cost, tuple(t.dependencies))
+            for t in project.tasks
+        ),
+        project.risk_level,
+        project.team_size
+    ))
+
+
+def _write_html(fig: go.Figure, path: str, plotlyjs: str = 'cdn') -> None:
+    """
+    Write a figure as a standalone HTML page.
+
+    Args:
+        fig: Figure to write
+        path: Output path; a path ending in .gz is gzip-compressed
+        plotlyjs: 'cdn' to load plotly.js from its CDN, or 'inline' to
+            embed the ~3MB bundle so the page works offline
+    """
+    html = pio.to_html(
+        fig,
+        include_plotlyjs='cdn' if plotlyjs == 'cdn' else True,
+        full_html=True,
+        config={'responsive': True}
+    )
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'wt', encoding='utf-8') as f:
+        f.write(html)
+
+
 class GanttChartGenerator:
     """Generates interactive Gantt charts for project timelines."""
 
+    __slots__ = ('project', 'calculator')
+
     def __init__(self, project: Project):
         """Initialize Gantt chart generator."""
         self.project = project
         self.calculator = ProjectCalculator(project)
 
-    def generate_gantt_chart(self, start_date: datetime = None, save_path: str = None) -> go.Figure:
-        """Generate an interactive Gantt chart."""
+    def generate_gantt_chart(self, start_date: datetime = None, save_path: str = None,
+                             plotlyjs: str = 'cdn') -> go.Figure:
+        """
+        Generate an interactive Gantt chart.
+
+        Charts are cached by project fingerprint and start date, so repeat
+        calls only rebuild the Figure from its cached dict. The default
+        start date is today at midnight, so it stays stable across calls.
+        HTML written to save_path loads plotly.js from its CDN unless
+        plotlyjs='inline'; a save_path ending in .gz is gzip-compressed.
+        """
         if start_date is None:
-            start_date = datetime.now()
+            start_date = datetime.combine(date.today(), datetime.min.time())
 
-        schedule = self._calculate_schedule(start_date)
-        critical_path = self.project.get_critical_path()
-        critical_task_ids = [t.task_id for t in critical_path]
+        key = (_project_fingerprint(self.project), start_date.isoformat())
+        with _FIGURE_CACHE_LOCK:
+            entry = _FIGURE_CACHE.get(key)
+            if entry is not None:
+                _FIGURE_CACHE.move_to_end(key)
 
-        fig = go.Figure()
+        if entry is None:
+            # Build outside the lock; a concurrent build of the same key is harmless
+            schedule = self._calculate_schedule(start_date)
+            entry = (self._build_figure(schedule).to_dict(), self._schedule_span(schedule))
+            with _FIGURE_CACHE_LOCK:
+                _FIGURE_CACHE[key] = entry
+                if len(_FIGURE_CACHE) > _FIGURE_CACHE_SIZE:
+                    _FIGURE_CACHE.popitem(last=False)
 
-        # Add bars for each task
-        for task in self.project.tasks:
+        figure_dict, span = entry
+        fig = go.Figure(figure_dict)
+        self._add_today_marker(fig, span)
+
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
+            _write_html(fig, save_path, plotlyjs)
+
+        return fig
+
+    def _build_figure(self, schedule: Dict) -> go.Figure:
+        """Build the task bars, layout and legend from a computed schedule."""
+        critical_task_ids = frozenset(self.project._graph.critical_path_ids)
+
+        # Group bars into one trace per color, so Plotly validates two traces instead of one per task
+        groups = {
+            True: {'x': [], 'y': [], 'base': [], 'hovertext': []},
+            False: {'x': [], 'y': [], 'base': [], 'hovertext': []},
+        }
+        tasks = self.project.tasks
+        format_hover = _HOVER_TMPL.format
+        for task in tasks:
             task_info = schedule[task.task_id]
             is_critical = task.task_id in critical_task_ids
-            color = '#E74C3C' if is_critical else '#3498DB'
 
-            fig.add_trace(go.Bar(
+            group = groups[is_critical]
+            group['x'].append(task_info['end_date'])
+            group['y'].append(task.name)
+            group['base'].append(task_info['start_date'])
+            group['hovertext'].append(format_hover(
                 name=task.name,
-                x=[task_info['end_date']],
-                y=[task.name],
-                base=task_info['start_date'],
-                orientation='h',
-                marker=dict(color=color, line=dict(color='rgba(0,0,0,0.5)', width=2)),
-                hovertemplate=(
-                    f'<b>{task.name}</b><br>' +
-                    f'Start: {task_info["start_date"].strftime("%b %d, %Y")}<br>' +
-                    f'End: {task_info["end_date"].strftime("%b %d, %Y")}<br>' +
-                    f'Duration: {task.estimated_days:.1f} days<br>' +
-                    f'Cost: ${task.base_cost:,.2f}<br>' +
-                    ('<b>⚠ CRITICAL PATH</b><br>' if is_critical else '') +
-                    '<extra></extra>'
-                ),
-                showlegend=False,
-                width=0.7
+                start=task_info['start_date'],
+                end=task_info['end_date'],
+                days=task.estimated_days,
+                cost=task.base_cost,
+                critical=_CRITICAL_LABEL if is_critical else ''
             ))
 
-        # Update layout with better visibility
-        fig.update_layout(
-            title=dict(
-                text=f'<b>Project Timeline: {self.project.name}</b>',
-                x=0.5,
-                xanchor='center',
-                font=dict(size=24, color='#000000', family='Arial Black')
-            ),
-            xaxis=dict(
-                title=dict(text='<b>Date</b>', font=dict(size=16, color='#000000')),
-                gridcolor='#D0D0D0',
-                showgrid=True,
-                linecolor='#000000',
-                linewidth=2,
-                tickfont=dict(size=12, color='#000000')
-            ),
-            yaxis=dict(
-                title=dict(text='<b>Tasks</b>', font=dict(size=16, color='#000000')),
-                gridcolor='#D0D0D0',
-                showgrid=True,
-                linecolor='#000000',
-                linewidth=2,
-                tickfont=dict(size=14, color='#000000', family='Arial')
-            ),
-            plot_bgcolor='#FFFFFF',
-            paper_bgcolor='#F5F5F5',
-            height=max(500, len(self.project.tasks) * 80),
-            hovermode='closest',
-            margin=dict(l=250, r=120, t=120, b=100),
-            bargap=0.2
-        )
-
-        # Add legend with better styling
-        fig.add_trace(go.Scatter(
-            x=[None], y=[None], mode='markers',
-            marker=dict(size=18, color='#E74C3C', symbol='square', line=dict(color='#000', width=2)),
-            showlegend=True, name='Critical Path Tasks'
+        fig = go.Figure(layout=go.Layout(
+            template=_GANTT_TEMPLATE,
+            title_text=f'<b>Project Timeline: {self.project.name}</b>',
+            height=max(500, len(tasks) * 80),
+            # Keep tasks in project order across both traces
+            yaxis_categoryarray=[task.name for task in tasks]
         ))
 
-        fig.add_trace(go.Scatter(
-            x=[None], y=[None], mode='markers',
-            marker=dict(size=18, color='#3498DB', symbol='square', line=dict(color='#000', width=2)),
-            showlegend=True, name='Regular Tasks'
-        ))
+        for is_critical, name, color in [
+            (True, 'Critical Path Tasks', '#E74C3C'),
+            (False, 'Regular Tasks', '#3498DB'),
+        ]:
+            fig.add_trace(go.Bar(
+                name=name,
+                orientation='h',
+                marker=dict(color=color, line=dict(color='rgba(0,0,0,0.5)', width=2)),
+                hovertemplate='%{hovertext}<extra></extra>',
+                showlegend=True,
+                width=0.7,
+                **groups[is_critical]
+            ))
 
-        fig.update_layout(
-            legend=dict(
-                x=1.02, y=1, xanchor='left', yanchor='top',
-                bgcolor='white',
-                bordercolor='#000000', borderwidth=2,
-                font=dict(size=13, color='#000000')
-            )
+        return fig
+
+    @staticmethod
+    def _schedule_span(schedule: Dict) -> Optional[Tuple[datetime, datetime]]:
+        """First start and last end date of a schedule, or None if it is empty."""
+        if not schedule:
+            return None
+        return (
+            min(info['start_date'] for info in schedule.values()),
+            max(info['end_date'] for info in schedule.values())
         )
 
-        # Add today marker
+    @staticmethod
+    def _add_today_marker(fig: go.Figure, span: Optional[Tuple[datetime, datetime]]):
+        """Mark today's date if it falls within the project timeline span."""
         today = datetime.now()
-        if schedule:
-            all_starts = [info['start_date'] for info in schedule.values()]
-            all_ends = [info['end_date'] for info in schedule.values()]
+        if span is not None:
+            first_start, last_end = span
 
-            if min(all_starts) <= today <= max(all_ends):
+            if first_start <= today <= last_end:
                 fig.add_shape(
                     type="line", x0=today, x1=today, y0=0, y1=1, yref="paper",
                     line=dict(color="#27AE60", width=3, dash="dash")
@@ -127,30 +244,28 @@ class GanttChartGenerator:
                     bgcolor='white', bordercolor='#27AE60', borderwidth=2, borderpad=6
                 )
 
-        if save_path:
-            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
-            fig.write_html(save_path)
-
-        return fig
-
     def _calculate_schedule(self, start_date: datetime) -> Dict:
-        """Calculate start and end dates for all tasks."""
-        schedule = {}
-        earliest_start_days = {}
+        """
+        Calculate start and end dates for all tasks.
 
-        for task in self.project.tasks:
-            earliest_start = 0.0
+        Day offsets are converted to dates in one vectorized datetime64 add
+        rather than two timedelta objects per task.
+        """
+        schedule = {}
+        tasks = self.project.tasks
+        earliest_start_days = self.project._graph.earliest_start
 
-            for dep_id in task.dependencies:
-                if dep_id in earliest_start_days:
-                    dep_task = self.project.get_task_by_id(dep_id)
-                    dep_end = earliest_start_days[dep_id] + dep_task.estimated_days
-                    earliest_start = max(earliest_start, dep_end)
+        start_days = np.array([earliest_start_days[task.task_id] for task in tasks], dtype=np.float64)
+        durations = self.project._est_days_arr
 
-            earliest_start_days[task.task_id] = earliest_start
-            task_start_date = start_date + timedelta(days=earliest_start)
-            task_end_date = task_start_date + timedelta(days=task.estimated_days)
+        # Round offsets to whole microseconds, as timedelta(days=...) does
+        origin = np.datetime64(start_date, 'us')
+        start_dates = origin + np.rint(start_days * _US_PER_DAY).astype('timedelta64[us]')
+        end_dates = start_dates + np.rint(durations * _US_PER_DAY).astype('timedelta64[us]')
 
+        for task, task_start_date, task_end_date, earliest_start in zip(
+                tasks, start_dates.tolist(), end_dates.tolist(), start_days.tolist()
+        ):
             schedule[task.task_id] = {
                 'start_date': task_start_date,
                 'end_date': task_end_date,
@@ -160,13 +275,72 @@ class GanttChartGenerator:
 
         return schedule
 
-    def save_as_image(self, fig: go.Figure, filepath: str):
-        """Save Gantt chart as static image."""
+    def generate_static_png(self, filepath: str, start_date: datetime = None) -> str:
+        """
+        Render the Gantt chart straight to a PNG with Matplotlib.
+
+        Skips Plotly's image export, which needs Kaleido and a headless
+        browser; use it when an interactive chart is not needed.
+        """
+        if start_date is None:
+            start_date = datetime.combine(date.today(), datetime.min.time())
+
+        schedule = self._calculate_schedule(start_date)
+        critical_task_ids = frozenset(self.project._graph.critical_path_ids)
+        tasks = self.project.tasks
+
+        fig = Figure(figsize=(14, max(6, len(tasks) * 0.8)))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+
+        for i, task in enumerate(tasks):
+            task_info = schedule[task.task_id]
+            color = '#E74C3C' if task.task_id in critical_task_ids else '#3498DB'
+            ax.broken_barh(
+                [(mdates.date2num(task_info['start_date']), task.estimated_days)],
+                (i - 0.35, 0.7),
+                facecolors=color,
+                edgecolor='black'
+            )
+
+        ax.set_yticks(range(len(tasks)))
+        ax.set_yticklabels([task.name for task in tasks])
+        ax.xaxis_date()
+        ax.set_xlabel('Date', fontweight='bold')
+        ax.set_ylabel('Tasks', fontweight='bold')
+        ax.set_title(f'Project Timeline: {self.project.name}', fontsize=14, fontweight='bold')
+        ax.grid(axis='x', alpha=0.3)
+        ax.legend(handles=[
+            mpatches.Patch(color='#E74C3C', label='Critical Path Tasks'),
+            mpatches.Patch(color='#3498DB', label='Regular Tasks'),
+        ], loc='upper left', bbox_to_anchor=(1.01, 1))
+        fig.autofmt_xdate()
+        fig.tight_layout()
+
+        os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
+        fig.savefig(filepath, dpi=120)
+
+        return filepath
+
+    def save_as_image(self, fig: go.Figure, filepath: str, fast: bool = False,
+                      start_date: datetime = None):
+        """
+        Save Gantt chart as static image.
+
+        With fast=True, PNG output is redrawn by generate_static_png instead
+        of exporting the Plotly figure, so pass the start_date the figure was
+        generated with (default today, as for generate_gantt_chart).
+        """
+        if fast and filepath.endswith('.png'):
+            self.generate_static_png(filepath, start_date)
+            print(f"Gantt chart saved to {filepath}")
+            return
+
         try:
             fig.write_image(filepath, width=1400, height=max(600, len(self.project.tasks) * 60))
             print(f"Gantt chart saved to {filepath}")
         except Exception as e:
             print(f"Could not save image: {e}")
             html_path = filepath.replace('.png', '.html')
-            fig.write_html(html_path)
-            print(f"HTML chart saved to {html_path}")
\ No newline at end of file
+            _write_html(fig, html_path)
+            print(f"HTML chart saved to {html_path}")
@@ -4,18 +4,177 @@ PDF report generator for project analysis.
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image, Flowable
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
+from operator import itemgetter
+from typing import Iterator, List, Optional
+import asyncio
+import copy
+import hashlib
+import multiprocessing
 import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
 
 from src.project import Project
 from src.calculator import ProjectCalculator
 from src.risk_simulator import SimulationResult, RiskSimulator
 
 
+# Table styles are static, so each is built once and shared by every report.
+
+# Title page project info
+_INFO_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#34495E')),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+# Executive summary metrics
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1')]),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+])
+
+# Task breakdown
+_TASK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ECC71')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#E8F8F5')]),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Monte Carlo scenarios
+_SCENARIO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FADBD8')]),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+])
+
+
+# Shared stylesheet, built on first use; see _get_styles()
+_STYLES: Optional[StyleSheet1] = None
+_STYLES_LOCK = threading.Lock()
+
+
+def _build_styles() -> StyleSheet1:
+    """Build the sample stylesheet plus the report's custom paragraph styles."""
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#2C3E50'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Section header
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#34495E'),
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Subsection
+    styles.add(ParagraphStyle(
+        name='SubSection',
+        parent=styles['Heading3'],
+        fontSize=12,
+        textColor=colors.HexColor('#7F8C8D'),
+        spaceAfter=6,
+        fontName='Helvetica-Bold'
+    ))
+
+    return styles
+
+
+def _get_styles() -> StyleSheet1:
+    """
+    Return the report stylesheet shared by all generators.
+
+    Styles are only read while building reports, so one instance serves
+    every report instead of each generator rebuilding its own.
+    """
+    global _STYLES
+    if _STYLES is None:
+        with _STYLES_LOCK:
+            if _STYLES is None:
+                _STYLES = _build_styles()
+    return _STYLES
+
+
+@lru_cache(maxsize=64)
+def _chart_template(path: str, mtime_ns: int, width: float, height: float) -> Image:
+    """
+    Open a chart image once per file version.
+
+    The modification time is part of the cache key, so a chart rewritten
+    on disk is read again. The template itself never goes into a story.
+    """
+    image = Image(path, width=width, height=height)
+    image._img  # Open the reader now so every copy shares its decoded pixels
+    return image
+
+
+def _load_chart(path: str, width: float, height: float) -> Image:
+    """
+    Get a chart flowable for one report.
+
+    Flowables keep layout state from the document they were built into, so
+    each report gets a shallow copy of the cached template.
+    """
+    return copy.copy(_chart_template(path, os.stat(path).st_mtime_ns, width, height))
+
+
 class PDFReportGenerator:
     """
     Generates professional PDF reports for project analysis.
@@ -36,43 +195,52 @@ class PDFReportGenerator:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # Styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2C3E50'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
+        # Styles are shared by every report
+        self.styles = _get_styles()
+
+    @classmethod
+    def generate_reports_parallel(
+            cls,
+            projects: List[Project],
+            simulation_results: Optional[List[Optional[SimulationResult]]] = None,
+            chart_paths: Optional[List[Optional[dict]]] = None,
+            output_dir: str = "output/reports",
+            max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate one full report per project, each in its own process.
 
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#34495E'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
+        ReportLab's layout is CPU-bound Python, so separate processes scale
+        with cores where threads would contend for the GIL.
 
-        # Subsection
-        self.styles.add(ParagraphStyle(
-            name='SubSection',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            textColor=colors.HexColor('#7F8C8D'),
-            spaceAfter=6,
-            fontName='Helvetica-Bold'
-        ))
+        Args:
+            projects: Projects to report on
+            simulation_results: Optional Monte Carlo results, one per project
+            chart_paths: Optional chart path dicts, one per project
+            output_dir: Directory to save PDFs
+            max_workers: Worker process count (default: one per CPU)
+
+        Returns:
+            Paths to the generated PDFs, in project order
+        """
+        count = len(projects)
+        simulation_results = simulation_results or [None] * count
+        chart_paths = chart_paths or [None] * count
+
+        # Spawn rather than fork: reports usually follow a simulation, and a
+        # parent that has run the parallel Numba kernel cannot fork safely
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=context) as executor:
+            return list(executor.map(
+                _render_one, projects, simulation_results, chart_paths, [output_dir] * count
+            ))
+
+    def _precompute(self):
+        """Compute the calculator results every report section draws on, once per report."""
+        self._cost_breakdown = self.calculator.cost_breakdown
+        self._timeline_breakdown = self.calculator.calculate_timeline_breakdown()
+        self._task_costs = self.calculator.calculate_task_costs()
+        self._critical_path_info = self.calculator.get_critical_path_analysis()
 
     def generate_full_report(
             self,
@@ -83,6 +251,10 @@ class PDFReportGenerator:
         """
         Generate complete PDF report.
 
+        Reports are named by a digest of their inputs, so when an identical
+        report already exists it is returned without being rebuilt (its
+        "Report Generated" time is then that of the first build).
+
         Args:
             simulation_result: Optional Monte Carlo results
             simulator: Optional simulator instance
@@ -91,115 +263,218 @@ class PDFReportGenerator:
         Returns:
             Path to generated PDF
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self._report_path(self._content_key(simulation_result, simulator, chart_paths))
+        if os.path.exists(filepath):
+            return filepath
+
+        # Build content
+        self._precompute()
+        story = list(self._story_iter(simulation_result, simulator, chart_paths))
+
+        # Build PDF
+        self._build_pdf(story, filepath)
+
+        return filepath
+
+    async def generate_full_report_async(
+            self,
+            simulator: RiskSimulator = None,
+            chart_paths: dict = None
+    ) -> str:
+        """
+        Generate complete PDF report, running the simulation during layout.
+
+        The Monte Carlo run and the sections that do not depend on it are
+        built in worker threads at the same time; the simulation section
+        is added once both are done.
+
+        Args:
+            simulator: Optional simulator to run for the Monte Carlo section
+            chart_paths: Optional dict of chart file paths
+
+        Returns:
+            Path to generated PDF
+        """
+        def build_analysis() -> List[Flowable]:
+            self._precompute()
+            return list(self._analysis_story())
+
+        if simulator is not None:
+            simulation_result, story = await asyncio.gather(
+                asyncio.to_thread(simulator.run_simulation),
+                asyncio.to_thread(build_analysis)
+            )
+        else:
+            simulation_result, story = None, await asyncio.to_thread(build_analysis)
+
+        filepath = self._report_path(self._content_key(simulation_result, simulator, chart_paths))
+        if os.path.exists(filepath):
+            return filepath
+
+        story.extend(self._results_story(simulation_result, simulator, chart_paths))
+        await asyncio.to_thread(self._build_pdf, story, filepath)
+
+        return filepath
+
+    def _content_key(
+            self,
+            simulation_result: Optional[SimulationResult],
+            simulator: Optional[RiskSimulator],
+            chart_paths: Optional[dict]
+    ) -> str:
+        """
+        Digest of everything a report shows, apart from when it was generated.
+
+        The project is hashed field by field rather than pickled whole, so
+        whatever it happens to have cached does not change the key. Charts
+        count by path and modification time.
+        """
+        project = self.project
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(pickle.dumps((
+            project.name,
+            project.team_size,
+            project.risk_level,
+            [(t.task_id, t.name, t.estimated_days, t.cost_per_day, tuple(t.dependencies)) for t in project.tasks]
+        ), protocol=5))
+
+        # The simulation section is only included when both are given
+        if simulation_result and simulator:
+            hasher.update(np.asarray(simulation_result.costs).tobytes())
+            hasher.update(np.asarray(simulation_result.timelines).tobytes())
+
+        for chart_name, chart_path in sorted((chart_paths or {}).items()):
+            if chart_path and os.path.exists(chart_path):
+                hasher.update(pickle.dumps((chart_name, chart_path, os.stat(chart_path).st_mtime_ns), protocol=5))
+
+        return hasher.hexdigest()
+
+    def _report_path(self, content_key: str) -> str:
+        """Path for a report, named after the project and its content key."""
         project_slug = self.project.name.lower().replace(" ", "_")[:30]
-        filename = f"{project_slug}_report_{timestamp}.pdf"
-        filepath = os.path.join(self.output_dir, filename)
+        filename = f"{project_slug}_report_{content_key}.pdf"
+        return os.path.join(self.output_dir, filename)
+
+    @staticmethod
+    def _build_pdf(story: List[Flowable], filepath: str) -> None:
+        """
+        Lay out the story and write the PDF.
+
+        ReportLab writes into an in-memory buffer, which then reaches the
+        disk in a single write instead of many small ones during layout.
+        The write goes to a temporary file that is renamed over the final
+        path, so an existing report is never seen half-written.
 
-        # Create PDF document
+        Args:
+            story: Flowables to lay out
+            filepath: Where to save the PDF
+        """
+        buffer = BytesIO()
         doc = SimpleDocTemplate(
-            filepath,
+            buffer,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
             bottomMargin=18
         )
+        doc.build(story)
 
-        # Build content
-        story = []
-
-        # Title page
-        story.extend(self._build_title_page())
-        story.append(PageBreak())
-
-        # Executive summary
-        story.extend(self._build_executive_summary())
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Cost analysis
-        story.extend(self._build_cost_section())
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Timeline analysis
-        story.extend(self._build_timeline_section())
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Critical path
-        story.extend(self._build_critical_path_section())
-        story.append(PageBreak())
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(filepath) or '.')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
-        # Task breakdown
-        story.extend(self._build_task_breakdown())
-        story.append(PageBreak())
+    def _story_iter(
+            self,
+            simulation_result: Optional[SimulationResult],
+            simulator: Optional[RiskSimulator],
+            chart_paths: Optional[dict]
+    ) -> Iterator[Flowable]:
+        """
+        Iterate over the report's flowables in page order.
 
-        # Monte Carlo results (if available)
-        if simulation_result and simulator:
-            story.extend(self._build_simulation_section(simulation_result, simulator))
-            story.append(PageBreak())
+        Sections are generators, so flowables are created as the story is
+        consumed; call _precompute() first.
+        """
+        return chain(
+            self._analysis_story(),
+            self._results_story(simulation_result, simulator, chart_paths)
+        )
 
-        # Charts (if available)
-        if chart_paths:
-            story.extend(self._build_charts_section(chart_paths))
+    def _analysis_story(self) -> Iterator[Flowable]:
+        """Sections built from the calculator, title page through task breakdown."""
+        return chain.from_iterable((
+            self._build_title_page(), [PageBreak()],
+            self._build_executive_summary(), [Spacer(1, 0.2 * inch)],
+            self._build_cost_section(), [Spacer(1, 0.2 * inch)],
+            self._build_timeline_section(), [Spacer(1, 0.2 * inch)],
+            self._build_critical_path_section(), [PageBreak()],
+            self._build_task_breakdown(), [PageBreak()],
+        ))
 
-        # Build PDF
-        doc.build(story)
+    def _results_story(
+            self,
+            simulation_result: Optional[SimulationResult],
+            simulator: Optional[RiskSimulator],
+            chart_paths: Optional[dict]
+    ) -> Iterator[Flowable]:
+        """Simulation and chart sections; each is empty unless its inputs are given."""
+        simulation = (
+            chain(self._build_simulation_section(simulation_result, simulator), [PageBreak()])
+            if simulation_result and simulator else ()
+        )
+        charts = self._build_charts_section(chart_paths) if chart_paths else ()
 
-        return filepath
+        return chain(simulation, charts)
 
     def _build_title_page(self):
         """Build title page elements."""
-        elements = []
+        project = self.project
+        name, team_size, risk_level, task_count = (
+            project.name, project.team_size, project.risk_level_display, project.task_count
+        )
 
-        elements.append(Spacer(1, 2 * inch))
+        yield Spacer(1, 2 * inch)
 
         title = Paragraph(
-            f"<b>{self.project.name}</b>",
+            f"<b>{name}</b>",
             self.styles['CustomTitle']
         )
-        elements.append(title)
-        elements.append(Spacer(1, 0.3 * inch))
+        yield title
+        yield Spacer(1, 0.3 * inch)
 
         subtitle = Paragraph(
             "Project Cost & Risk Analysis Report",
             self.styles['Heading2']
         )
-        elements.append(subtitle)
-        elements.append(Spacer(1, 0.5 * inch))
+        yield subtitle
+        yield Spacer(1, 0.5 * inch)
 
         # Project info table
         info_data = [
-            ['Project Name:', self.project.name],
-            ['Team Size:', str(self.project.team_size)],
-            ['Risk Level:', self.project.risk_level.capitalize()],
-            ['Total Tasks:', str(self.project.task_count)],
+            ['Project Name:', name],
+            ['Team Size:', str(team_size)],
+            ['Risk Level:', risk_level],
+            ['Total Tasks:', str(task_count)],
             ['Report Generated:', datetime.now().strftime("%B %d, %Y at %I:%M %p")]
         ]
 
         info_table = Table(info_data, colWidths=[2 * inch, 4 * inch])
-        info_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#34495E')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-
-        elements.append(info_table)
+        info_table.setStyle(_INFO_TABLE_STYLE)
 
-        return elements
+        yield info_table
 
     def _build_executive_summary(self):
         """Build executive summary section."""
-        elements = []
-
-        elements.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        yield Paragraph("Executive Summary", self.styles['SectionHeader'])
 
-        cost_breakdown = self.calculator.calculate_cost_breakdown()
-        timeline_breakdown = self.calculator.calculate_timeline_breakdown()
+        cost_breakdown = self._cost_breakdown
+        timeline_breakdown = self._timeline_breakdown
 
         summary_data = [
             ['Metric', 'Value'],
@@ -211,32 +486,15 @@ class PDFReportGenerator:
         ]
 
         summary_table = Table(summary_data, colWidths=[3 * inch, 3 * inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ]))
-
-        elements.append(summary_table)
-
-        return elements
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
+
+        yield summary_table
 
     def _build_cost_section(self):
         """Build cost analysis section."""
-        elements = []
-
-        elements.append(Paragraph("Cost Analysis", self.styles['SectionHeader']))
+        yield Paragraph("Cost Analysis", self.styles['SectionHeader'])
 
-        cost_breakdown = self.calculator.calculate_cost_breakdown()
+        cost_breakdown = self._cost_breakdown
 
         cost_text = f"""
         The project has a base cost of <b>${cost_breakdown['base_cost']:,.2f}</b>. 
@@ -247,17 +505,13 @@ class PDFReportGenerator:
         per team member.
         """
 
-        elements.append(Paragraph(cost_text, self.styles['Normal']))
-
-        return elements
+        yield Paragraph(cost_text, self.styles['Normal'])
 
     def _build_timeline_section(self):
         """Build timeline analysis section."""
-        elements = []
+        yield Paragraph("Timeline Analysis", self.styles['SectionHeader'])
 
-        elements.append(Paragraph("Timeline Analysis", self.styles['SectionHeader']))
-
-        timeline_breakdown = self.calculator.calculate_timeline_breakdown()
+        timeline_breakdown = self._timeline_breakdown
 
         timeline_text = f"""
         <b>Realistic Estimate:</b> {timeline_breakdown['parallel_realistic']:.1f} days<br/>
@@ -268,17 +522,13 @@ class PDFReportGenerator:
         If all tasks must run one after another.
         """
 
-        elements.append(Paragraph(timeline_text, self.styles['Normal']))
-
-        return elements
+        yield Paragraph(timeline_text, self.styles['Normal'])
 
     def _build_critical_path_section(self):
         """Build critical path section."""
-        elements = []
-
-        elements.append(Paragraph("Critical Path Analysis", self.styles['SectionHeader']))
+        yield Paragraph("Critical Path Analysis", self.styles['SectionHeader'])
 
-        critical_path_info = self.calculator.get_critical_path_analysis()
+        critical_path_info = self._critical_path_info
 
         if critical_path_info['exists']:
             cp_text = f"""
@@ -287,64 +537,40 @@ class PDFReportGenerator:
             (adjusted: <b>{critical_path_info['adjusted_duration']:.1f} days</b>).
             These tasks directly impact the project timeline and should be monitored closely.
             """
-            elements.append(Paragraph(cp_text, self.styles['Normal']))
-            elements.append(Spacer(1, 0.1 * inch))
+            yield Paragraph(cp_text, self.styles['Normal'])
+            yield Spacer(1, 0.1 * inch)
 
-            elements.append(Paragraph("Critical Path Tasks:", self.styles['SubSection']))
+            yield Paragraph("Critical Path Tasks:", self.styles['SubSection'])
 
+            normal = self.styles['Normal']
             for task_name in critical_path_info['tasks']:
-                elements.append(Paragraph(f"• {task_name}", self.styles['Normal']))
+                yield Paragraph(f"• {task_name}", normal)
         else:
-            elements.append(Paragraph("No critical path identified.", self.styles['Normal']))
-
-        return elements
+            yield Paragraph("No critical path identified.", self.styles['Normal'])
 
     def _build_task_breakdown(self):
         """Build task breakdown table."""
-        elements = []
-
-        elements.append(Paragraph("Task Breakdown", self.styles['SectionHeader']))
+        yield Paragraph("Task Breakdown", self.styles['SectionHeader'])
 
-        task_costs = self.calculator.calculate_task_costs()
+        task_costs = self._task_costs
 
-        # Table data
+        # Table data, pulling each task's fields with one itemgetter call
+        fields = itemgetter('task_name', 'days', 'cost_per_day', 'base_cost', 'adjusted_cost')
         data = [['Task Name', 'Days', '$/Day', 'Base Cost', 'Adjusted Cost']]
-
-        for tc in task_costs:
-            data.append([
-                tc['task_name'],
-                f"{tc['days']:.1f}",
-                f"${tc['cost_per_day']:,.0f}",
-                f"${tc['base_cost']:,.2f}",
-                f"${tc['adjusted_cost']:,.2f}"
-            ])
+        data.extend(
+            [name, f"{days:.1f}", f"${rate:,.0f}", f"${base:,.2f}", f"${adjusted:,.2f}"]
+            for name, days, rate, base, adjusted in map(fields, task_costs)
+        )
 
         # Create table
         task_table = Table(data, colWidths=[2.2 * inch, 0.8 * inch, 0.8 * inch, 1.1 * inch, 1.1 * inch])
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ECC71')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#E8F8F5')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ]))
-
-        elements.append(task_table)
-
-        return elements
+        task_table.setStyle(_TASK_TABLE_STYLE)
+
+        yield task_table
 
     def _build_simulation_section(self, result: SimulationResult, simulator: RiskSimulator):
         """Build Monte Carlo simulation section."""
-        elements = []
-
-        elements.append(Paragraph("Monte Carlo Risk Simulation", self.styles['SectionHeader']))
+        yield Paragraph("Monte Carlo Risk Simulation", self.styles['SectionHeader'])
 
         scenarios = result.get_scenarios()
         risk_analysis = simulator.analyze_risk_drivers(result)
@@ -379,44 +605,44 @@ class PDFReportGenerator:
         ]
 
         scenario_table = Table(scenario_data, colWidths=[1.5 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch])
-        scenario_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FADBD8')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ]))
-
-        elements.append(scenario_table)
-        elements.append(Spacer(1, 0.2 * inch))
+        scenario_table.setStyle(_SCENARIO_TABLE_STYLE)
+
+        yield scenario_table
+        yield Spacer(1, 0.2 * inch)
 
         # Risk drivers
-        elements.append(Paragraph("Primary Risk Drivers:", self.styles['SubSection']))
+        yield Paragraph("Primary Risk Drivers:", self.styles['SubSection'])
+        normal = self.styles['Normal']
         for driver in risk_analysis['primary_drivers']:
-            elements.append(Paragraph(f"• {driver}", self.styles['Normal']))
-
-        return elements
+            yield Paragraph(f"• {driver}", normal)
 
     def _build_charts_section(self, chart_paths: dict):
         """Add charts to PDF."""
-        elements = []
-
-        elements.append(Paragraph("Visualizations", self.styles['SectionHeader']))
+        yield Paragraph("Visualizations", self.styles['SectionHeader'])
 
         # Add each chart if it exists
         for chart_name, chart_path in chart_paths.items():
             if chart_path and os.path.exists(chart_path):
                 try:
-                    img = Image(chart_path, width=6 * inch, height=4 * inch)
-                    elements.append(img)
-                    elements.append(Spacer(1, 0.3 * inch))
+                    img = _load_chart(chart_path, 6 * inch, 4 * inch)
                 except Exception as e:
                     print(f"Could not add chart {chart_name}: {e}")
+                    continue
+                yield img
+                yield Spacer(1, 0.3 * inch)
+
 
-        return elements
\ No newline at end of file
+def _render_one(
+        project: Project,
+        simulation_result: Optional[SimulationResult],
+        chart_paths: Optional[dict],
+        output_dir: str
+) -> str:
+    """
+    Build one report in a worker process.
+
+    Module-level so it pickles; the simulator used for the risk-driver
+    summary is rebuilt here rather than sent across.
+    """
+    simulator = RiskSimulator(project) if simulation_result is not None else None
+    return PDFReportGenerator(project, output_dir).generate_full_report(simulation_result, simulator, chart_paths)
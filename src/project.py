@@ -2,8 +2,12 @@
 Project and Task data models.
 """
 
-from typing import List, Optional, Set
+from collections import deque
+from functools import cached_property
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 
 
 @dataclass
@@ -38,10 +42,30 @@ class Task:
         return len(self.dependencies) > 0
 
 
+@dataclass(frozen=True)
+class _GraphCache:
+    """
+    Dependency-graph data derived from a project's tasks.
+
+    Built once per Project and treated as read-only; Project.invalidate_cache()
+    discards it after tasks change.
+    """
+    topo_order: Tuple[str, ...]  # Kahn order, without tasks caught in a cycle
+    schedule_order: Tuple[str, ...]  # topo_order followed by any cycle tasks
+    indeg: Dict[str, int]  # Number of known dependencies per task
+    succ: Dict[str, Tuple[str, ...]]  # Dependents per task, one entry per dependency listed
+    id_to_task: Dict[str, Task]
+    earliest_start: Dict[str, float]  # Dependency-only start day per task
+    critical_path_ids: Tuple[str, ...]
+
+
 @dataclass
 class Project:
     """
     Represents a complete project with tasks and configuration.
+
+    Totals, dependency-graph data and per-task NumPy columns are derived
+    lazily and cached; call invalidate_cache() after mutating tasks in place.
     """
     name: str
     tasks: List[Task]
@@ -64,17 +88,22 @@ class Project:
 
         self.risk_level = self.risk_level.lower()
 
-    @property
+    @cached_property
+    def risk_level_display(self) -> str:
+        """Risk level formatted for reports, e.g. 'Medium'."""
+        return self.risk_level.capitalize()
+
+    @cached_property
     def total_base_cost(self) -> float:
         """Calculate total base cost across all tasks."""
-        return sum(task.base_cost for task in self.tasks)
+        return float(self._base_cost_arr.sum())
 
-    @property
+    @cached_property
     def total_estimated_days(self) -> float:
         """Calculate total estimated days (sum of all tasks, no parallelization)."""
-        return sum(task.estimated_days for task in self.tasks)
+        return float(self._est_days_arr.sum())
 
-    @property
+    @cached_property
     def task_count(self) -> int:
         """Get the number of tasks in the project."""
         return len(self.tasks)
@@ -89,10 +118,7 @@ class Project:
         Returns:
             The task if found, None otherwise
         """
-        for task in self.tasks:
-            if task.task_id == task_id:
-                return task
-        return None
+        return self._graph.id_to_task.get(task_id)
 
     def get_task_by_name(self, name: str) -> Optional[Task]:
         """
@@ -104,129 +130,214 @@ class Project:
         Returns:
             The task if found, None otherwise
         """
-        for task in self.tasks:
-            if task.name.lower() == name.lower():
-                return task
-        return None
+        return self._tasks_by_name.get(name.lower())
 
     def validate_dependencies(self) -> List[str]:
         """
         Validate that all task dependencies exist and check for circular dependencies.
 
+        Cycle detection only runs once every dependency resolves, so a
+        project with missing dependencies reports just those.
+
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
         task_ids = {task.task_id for task in self.tasks}
 
         # Check that all dependencies exist
-        for task in self.tasks:
-            for dep_id in task.dependencies:
-                if dep_id not in task_ids:
-                    errors.append(
-                        f"Task '{task.name}' depends on non-existent task '{dep_id}'"
-                    )
+        missing = set(chain.from_iterable(task.dependencies for task in self.tasks)) - task_ids
+        if missing:
+            return [
+                f"Task '{task.name}' depends on non-existent task '{dep_id}'"
+                for task in self.tasks
+                for dep_id in task.dependencies
+                if dep_id in missing
+            ]
 
         # Check for circular dependencies
         if self._has_circular_dependency():
-            errors.append("Project has circular dependencies")
+            return ["Project has circular dependencies"]
 
-        return errors
+        return []
 
     def _has_circular_dependency(self) -> bool:
         """
         Check if the project has circular dependencies using DFS.
 
+        The search is iterative, keeping a stack of (task, dependency
+        iterator) frames, so long dependency chains cannot hit Python's
+        recursion limit. Tasks are white until visited, gray while on the
+        stack and black once finished; reaching a gray task means a cycle.
+
         Returns:
             True if circular dependency exists, False otherwise
         """
+        WHITE, GRAY, BLACK = 0, 1, 2
+
         # Build adjacency list
         graph = {task.task_id: task.dependencies for task in self.tasks}
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
+        color = dict.fromkeys(graph, WHITE)
 
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
+        for start in graph:
+            if color[start] != WHITE:
+                continue
 
-            rec_stack.remove(node)
-            return False
+            color[start] = GRAY
+            stack = [(start, iter(graph[start]))]
 
-        for task in self.tasks:
-            if task.task_id not in visited:
-                if has_cycle(task.task_id):
-                    return True
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    state = color.get(neighbor, WHITE)
+                    if state == GRAY:
+                        return True
+                    if state == WHITE:
+                        color[neighbor] = GRAY
+                        stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                        break
+                else:
+                    color[node] = BLACK
+                    stack.pop()
 
         return False
 
-    def get_critical_path(self) -> List[Task]:
+    def invalidate_cache(self) -> None:
+        """Drop cached totals, dependency-graph data and task arrays after tasks have been changed."""
+        for name in (
+            'risk_level_display', 'total_base_cost', 'total_estimated_days', 'task_count',
+            '_graph', 'topological_tasks', '_tasks_by_name',
+            '_est_days_arr', '_cost_per_day_arr', '_base_cost_arr'
+        ):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _tasks_by_name(self) -> Dict[str, Task]:
+        """Tasks keyed by lower-cased name; the first task wins on duplicates."""
+        by_name = {}
+        for task in self.tasks:
+            by_name.setdefault(task.name.lower(), task)
+        return by_name
+
+    @cached_property
+    def _est_days_arr(self) -> np.ndarray:
+        """Estimated days per task, in project order."""
+        return np.fromiter((task.estimated_days for task in self.tasks), dtype=np.float64, count=len(self.tasks))
+
+    @cached_property
+    def _cost_per_day_arr(self) -> np.ndarray:
+        """Daily cost per task, in project order."""
+        return np.fromiter((task.cost_per_day for task in self.tasks), dtype=np.float64, count=len(self.tasks))
+
+    @cached_property
+    def _base_cost_arr(self) -> np.ndarray:
+        """Base cost per task, in project order."""
+        return self._est_days_arr * self._cost_per_day_arr
+
+    @cached_property
+    def _graph(self) -> "_GraphCache":
         """
-        Calculate the critical path (longest path) through the project.
-        Uses topological sort and longest path algorithm.
+        Build the dependency graph, schedule and critical path in one pass.
+
+        Kahn's algorithm orders the tasks; dependencies on unknown tasks are
+        ignored, and of several tasks sharing an ID only the first counts.
+        Tasks caught in a cycle are left out of topo_order and
+        appended to schedule_order in project order, where they only wait on
+        dependencies placed before them. A reverse pass over topo_order then
+        gives each task the longest chain starting at it.
 
         Returns:
-            List of tasks in the critical path
+            Frozen graph data shared by the calculator and Gantt chart
         """
-        # Build adjacency list and in-degree count
-        graph = {task.task_id: task.dependencies for task in self.tasks}
-        in_degree = {task.task_id: len(task.dependencies) for task in self.tasks}
+        id_to_task = {}
+        for task in self.tasks:
+            id_to_task.setdefault(task.task_id, task)
+
+        successors = {task_id: [] for task_id in id_to_task}
+        in_degree = {}
+
+        for task in id_to_task.values():
+            known_deps = [dep_id for dep_id in task.dependencies if dep_id in successors]
+            in_degree[task.task_id] = len(known_deps)
+            for dep_id in known_deps:
+                successors[dep_id].append(task.task_id)
 
-        # Calculate earliest start times
-        earliest_start = {task.task_id: 0 for task in self.tasks}
-        queue = [task.task_id for task in self.tasks if in_degree[task.task_id] == 0]
+        indeg = dict(in_degree)
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        order = []
 
         while queue:
-            current_id = queue.pop(0)
-            current_task = self.get_task_by_id(current_id)
-
-            # Update dependent tasks
-            for task in self.tasks:
-                if current_id in task.dependencies:
-                    # Update earliest start time
-                    earliest_start[task.task_id] = max(
-                        earliest_start[task.task_id],
-                        earliest_start[current_id] + current_task.estimated_days
-                    )
-
-                    # Decrease in-degree and add to queue if ready
-                    in_degree[task.task_id] -= 1
-                    if in_degree[task.task_id] == 0:
-                        queue.append(task.task_id)
-
-        # Find the task with the latest finish time (end of critical path)
-        end_task_id = max(
-            earliest_start.keys(),
-            key=lambda tid: earliest_start[tid] + self.get_task_by_id(tid).estimated_days
+            current_id = queue.popleft()
+            order.append(current_id)
+
+            for succ_id in successors[current_id]:
+                in_degree[succ_id] -= 1
+                if in_degree[succ_id] == 0:
+                    queue.append(succ_id)
+
+        # Earliest start days from dependencies alone
+        placed = set(order)
+        schedule_order = order + [task_id for task_id in id_to_task if task_id not in placed]
+        earliest_start = {}
+        for task_id in schedule_order:
+            start = 0.0
+            for dep_id in id_to_task[task_id].dependencies:
+                if dep_id in earliest_start:
+                    start = max(start, earliest_start[dep_id] + id_to_task[dep_id].estimated_days)
+            earliest_start[task_id] = start
+
+        # Longest remaining duration from each task, and the successor that gives it
+        longest = {}
+        next_on_path = {}
+
+        for task_id in reversed(order):
+            best_id = None
+            best_length = 0.0
+            for succ_id in successors[task_id]:
+                if succ_id in longest and longest[succ_id] > best_length:
+                    best_id = succ_id
+                    best_length = longest[succ_id]
+
+            longest[task_id] = id_to_task[task_id].estimated_days + best_length
+            next_on_path[task_id] = best_id
+
+        # Follow the chain from the task that starts the longest path
+        critical_path_ids = []
+        current_id = max(order, key=longest.__getitem__) if order else None
+
+        while current_id is not None:
+            critical_path_ids.append(current_id)
+            current_id = next_on_path[current_id]
+
+        return _GraphCache(
+            topo_order=tuple(order),
+            schedule_order=tuple(schedule_order),
+            indeg=indeg,
+            succ={task_id: tuple(succ_ids) for task_id, succ_ids in successors.items()},
+            id_to_task=id_to_task,
+            earliest_start=earliest_start,
+            critical_path_ids=tuple(critical_path_ids)
         )
 
-        # Backtrack to find the critical path
-        critical_path = []
-        current_id = end_task_id
-
-        while current_id:
-            current_task = self.get_task_by_id(current_id)
-            critical_path.insert(0, current_task)
+    @cached_property
+    def topological_tasks(self) -> Tuple[Task, ...]:
+        """
+        Tasks ordered so that every task comes after its dependencies.
 
-            # Find the predecessor on the critical path
-            if not current_task.dependencies:
-                break
+        Tasks caught in a dependency cycle follow the rest in project order.
+        Tasks sharing an ID appear once, as the first of them.
+        """
+        id_to_task = self._graph.id_to_task
+        return tuple(id_to_task[task_id] for task_id in self._graph.schedule_order)
 
-            # Find dependency that determines earliest start
-            current_id = None
-            for dep_id in current_task.dependencies:
-                dep_task = self.get_task_by_id(dep_id)
-                if earliest_start[dep_id] + dep_task.estimated_days == earliest_start[current_task.task_id]:
-                    current_id = dep_id
-                    break
+    def get_critical_path(self) -> List[Task]:
+        """
+        Calculate the critical path (longest path) through the project.
 
-        return critical_path
+        Returns:
+            List of tasks in the critical path
+        """
+        graph = self._graph
+        return [graph.id_to_task[task_id] for task_id in graph.critical_path_ids]
 
     def get_independent_tasks(self) -> List[Task]:
         """
@@ -243,7 +354,7 @@ class Project:
             f"Project: {self.name}\n"
             f"Tasks: {self.task_count}\n"
             f"Team Size: {self.team_size}\n"
-            f"Risk Level: {self.risk_level.capitalize()}\n"
+            f"Risk Level: {self.risk_level_display}\n"
             f"Base Cost: ${self.total_base_cost:,.2f}\n"
             f"Total Estimated Days: {self.total_estimated_days:.1f}"
         )
\ No newline at end of file
@@ -2,58 +2,180 @@
 Monte Carlo risk simulation for project cost and timeline analysis.
 """
 
-import random
-from typing import Dict, List, Tuple
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import chain
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from src.project import Project
 from src.calculator import ProjectCalculator
-from src.utils import calculate_percentile
+from src._mc_kernel import NUMBA_AVAILABLE, cp_batch
+
+
+# Percentiles read by the scenario table and the risk-driver analysis
+_SCENARIO_PERCENTILES = (10, 50, 75, 90)
+
+
+# Risk drivers in report order, each with its test on
+# (project, cost_cv, timeline_cv, critical_path_length)
+_DRIVER_TABLE = (
+    ("High inherent project risk level",
+     lambda project, cost_cv, timeline_cv, cp_len: project.risk_level == 'high'),
+    ("Limited team resources relative to task count",
+     lambda project, cost_cv, timeline_cv, cp_len: project.team_size < project.task_count / 2),
+    ("High cost variability",
+     lambda project, cost_cv, timeline_cv, cp_len: cost_cv > 0.2),
+    ("High timeline uncertainty",
+     lambda project, cost_cv, timeline_cv, cp_len: timeline_cv > 0.2),
+    # Complex dependencies
+    ("Long critical path with many dependencies",
+     lambda project, cost_cv, timeline_cv, cp_len: cp_len > project.task_count * 0.6),
+)
+
+
+def _moments(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and population standard deviation, accumulated in float64.
+
+    The samples are float32, so summing in double keeps the mean accurate
+    for large runs without widening the stored arrays.
+
+    Args:
+        values: Sample array
+
+    Returns:
+        Tuple of (mean, std), or (0.0, 0.0) for an empty array
+    """
+    if len(values) == 0:
+        return 0.0, 0.0
+
+    mean = values.mean(dtype=np.float64)
+    centered = np.subtract(values, mean, dtype=np.float64)
+    return float(mean), float(np.sqrt(np.dot(centered, centered) / len(values)))
+
+
+def _sorted_percentile(values: np.ndarray, percentile: float) -> float:
+    """
+    Percentile of an already sorted array with linear interpolation.
+
+    Matches np.percentile(..., method='linear') without re-sorting.
+
+    Args:
+        values: Ascending array
+        percentile: Percentile (0-100)
+
+    Returns:
+        Interpolated value, or 0.0 for an empty array
+
+    Raises:
+        ValueError: If percentile is outside [0, 100]
+    """
+    if not 0 <= percentile <= 100:
+        raise ValueError(f"Percentiles must be in the range [0, 100]. Got: {percentile}")
+
+    n = len(values)
+    if n == 0:
+        return 0.0
+
+    idx = (n - 1) * percentile / 100
+    lo = int(idx)
+    hi = min(lo + 1, n - 1)
+    weight = idx - lo
+    return float(values[lo]) * (1 - weight) + float(values[hi]) * weight
 
 
 @dataclass
 class SimulationResult:
     """
     Results from a Monte Carlo simulation run.
+
+    Costs and timelines are stored as float32; they only feed histograms
+    and percentile queries, which do not need double precision.
     """
-    costs: List[float]
-    timelines: List[float]
+    costs: np.ndarray
+    timelines: np.ndarray
     iterations: int
 
+    @cached_property
+    def _cost_moments(self) -> Tuple[float, float]:
+        """Mean and standard deviation of costs, computed once."""
+        return _moments(self.costs)
+
+    @cached_property
+    def _timeline_moments(self) -> Tuple[float, float]:
+        """Mean and standard deviation of timelines, computed once."""
+        return _moments(self.timelines)
+
     @property
     def cost_mean(self) -> float:
         """Average cost across all simulations."""
-        return sum(self.costs) / len(self.costs) if self.costs else 0.0
+        return self._cost_moments[0]
 
     @property
     def timeline_mean(self) -> float:
         """Average timeline across all simulations."""
-        return sum(self.timelines) / len(self.timelines) if self.timelines else 0.0
+        return self._timeline_moments[0]
 
     @property
     def cost_std(self) -> float:
         """Standard deviation of costs."""
-        if not self.costs:
-            return 0.0
-        mean = self.cost_mean
-        variance = sum((x - mean) ** 2 for x in self.costs) / len(self.costs)
-        return variance ** 0.5
+        return self._cost_moments[1]
 
     @property
     def timeline_std(self) -> float:
         """Standard deviation of timelines."""
-        if not self.timelines:
-            return 0.0
-        mean = self.timeline_mean
-        variance = sum((x - mean) ** 2 for x in self.timelines) / len(self.timelines)
-        return variance ** 0.5
+        return self._timeline_moments[1]
+
+    @cached_property
+    def _costs_sorted(self) -> np.ndarray:
+        """Costs sorted once, shared by every percentile query."""
+        return np.sort(self.costs)
+
+    @cached_property
+    def _timelines_sorted(self) -> np.ndarray:
+        """Timelines sorted once, shared by every percentile query."""
+        return np.sort(self.timelines)
+
+    @cached_property
+    def _cost_percentiles(self) -> Dict[float, float]:
+        """Cost at each of the scenario percentiles."""
+        return {p: _sorted_percentile(self._costs_sorted, p) for p in _SCENARIO_PERCENTILES}
+
+    @cached_property
+    def _timeline_percentiles(self) -> Dict[float, float]:
+        """Timeline at each of the scenario percentiles."""
+        return {p: _sorted_percentile(self._timelines_sorted, p) for p in _SCENARIO_PERCENTILES}
 
     def get_cost_percentile(self, percentile: float) -> float:
         """Get cost at specific percentile (0-100)."""
-        return calculate_percentile(self.costs, percentile)
+        cached = self._cost_percentiles.get(percentile)
+        return cached if cached is not None else _sorted_percentile(self._costs_sorted, percentile)
 
     def get_timeline_percentile(self, percentile: float) -> float:
         """Get timeline at specific percentile (0-100)."""
-        return calculate_percentile(self.timelines, percentile)
+        cached = self._timeline_percentiles.get(percentile)
+        return cached if cached is not None else _sorted_percentile(self._timelines_sorted, percentile)
+
+    def compute_all_stats(self) -> Dict[str, float]:
+        """
+        Collect the summary statistics the charts and reports read.
+
+        Returns:
+            Dictionary with cost_mean, cost_std, cost_p10/p50/p75/p90 and
+            the same keys for timeline
+        """
+        stats = {
+            'cost_mean': self.cost_mean,
+            'cost_std': self.cost_std,
+            'timeline_mean': self.timeline_mean,
+            'timeline_std': self.timeline_std,
+        }
+        for p in _SCENARIO_PERCENTILES:
+            stats[f'cost_p{p}'] = self._cost_percentiles[p]
+            stats[f'timeline_p{p}'] = self._timeline_percentiles[p]
+        return stats
 
     def get_scenarios(self) -> Dict[str, Dict[str, float]]:
         """
@@ -62,10 +184,13 @@ class SimulationResult:
         Returns:
             Dictionary with scenario data
         """
+        costs = self._cost_percentiles
+        timelines = self._timeline_percentiles
+
         return {
             'best_case': {
-                'cost': self.get_cost_percentile(10),
-                'timeline': self.get_timeline_percentile(10),
+                'cost': costs[10],
+                'timeline': timelines[10],
                 'probability': '10% chance of being this good or better'
             },
             'expected': {
@@ -74,18 +199,18 @@ class SimulationResult:
                 'probability': 'Most likely outcome (mean)'
             },
             'worst_case': {
-                'cost': self.get_cost_percentile(90),
-                'timeline': self.get_timeline_percentile(90),
+                'cost': costs[90],
+                'timeline': timelines[90],
                 'probability': '10% chance of being this bad or worse'
             },
             'p50': {
-                'cost': self.get_cost_percentile(50),
-                'timeline': self.get_timeline_percentile(50),
+                'cost': costs[50],
+                'timeline': timelines[50],
                 'probability': '50% confidence level (median)'
             },
             'p75': {
-                'cost': self.get_cost_percentile(75),
-                'timeline': self.get_timeline_percentile(75),
+                'cost': costs[75],
+                'timeline': timelines[75],
                 'probability': '25% chance of exceeding this'
             }
         }
@@ -96,82 +221,123 @@ class RiskSimulator:
     Monte Carlo simulator for project risk analysis.
     """
 
-    def __init__(self, project: Project, iterations: int = 1000):
+    def __init__(self, project: Project, iterations: int = 1000, seed: Optional[int] = None):
         """
         Initialize the risk simulator.
 
         Args:
             project: The project to simulate
             iterations: Number of Monte Carlo iterations (default 1000)
+            seed: Optional random seed for reproducible runs
         """
         self.project = project
         self.iterations = max(100, iterations)  # Minimum 100 iterations
+        self.seed = seed
         self.calculator = ProjectCalculator(project)
+        self._rng = np.random.default_rng(seed)
 
-    def run_simulation(self) -> SimulationResult:
+    def refresh(self) -> None:
+        """Drop cached task columns and dependency arrays after the project has been changed."""
+        self.calculator.refresh()
+        for name in ('_task_columns', '_dependency_arrays', '_critical_path_length'):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _task_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-task base cost and estimated days as float32 columns.
+
+        Returns:
+            Tuple of (base_costs, estimated_days) arrays, in project task order
+        """
+        project = self.project
+        return (
+            project._base_cost_arr.astype(np.float32),
+            project._est_days_arr.astype(np.float32)
+        )
+
+    def run_simulation(self, workers: Optional[int] = None) -> SimulationResult:
         """
         Run Monte Carlo simulation.
 
+        All scenarios are drawn at once as (iterations, tasks) matrices and
+        reduced along the task axis, so per-scenario work happens in NumPy
+        rather than in a Python loop. Both draws reuse one float32 buffer
+        that is scaled in place, keeping peak memory at a single matrix.
+
+        Args:
+            workers: Split the iterations across this many processes. Each
+                shard gets an independent stream spawned from the seed, so a
+                seeded run is reproducible for a given worker count (but
+                differs from the single-process result).
+
         Returns:
             SimulationResult with cost and timeline distributions
         """
-        costs = []
-        timelines = []
+        if workers is not None and workers > 1:
+            return self._run_sharded(workers)
+
+        base_costs, estimated_days = self._task_columns
+        shape = (self.iterations, len(base_costs))
+        variation_range = self._get_variation_range()
+
+        buf = np.empty(shape, dtype=np.float32)
+
+        # Cost variation (labor rate fluctuation, resource availability).
+        # sum(base * (low + span * u)) == low * sum(base) + u @ (span * base)
+        low = 1.0 - variation_range * 0.5
+        span = (1.0 + variation_range) - low
+        self._rng.random(out=buf, dtype=np.float32)
+        costs = buf @ (base_costs * np.float32(span))
+        costs += np.float32(low * base_costs.sum())
+
+        # Timeline variation (delays, unexpected issues, efficiency)
+        low = 1.0 - variation_range * 0.3
+        span = (1.0 + variation_range * 1.2) - low
+        self._rng.random(out=buf, dtype=np.float32)
+        np.multiply(buf, np.float32(span), out=buf)
+        np.add(buf, np.float32(low), out=buf)
+        durations = np.multiply(buf, estimated_days, out=buf)
+
+        # Calculate timelines considering dependencies and resources
+        timelines = self._calculate_scenario_timelines(durations)
 
-        for _ in range(self.iterations):
-            # Simulate one scenario
-            scenario_cost, scenario_timeline = self._simulate_single_scenario()
-            costs.append(scenario_cost)
-            timelines.append(scenario_timeline)
+        # Add risk-based overhead
+        risk_factors = self._get_risk_factors(self.iterations)
+        costs *= risk_factors
+        timelines *= risk_factors
 
         return SimulationResult(
-            costs=costs,
-            timelines=timelines,
+            costs=costs.astype(np.float32, copy=False),
+            timelines=timelines.astype(np.float32, copy=False),
             iterations=self.iterations
         )
 
-    def _simulate_single_scenario(self) -> Tuple[float, float]:
+    def _run_sharded(self, workers: int) -> SimulationResult:
         """
-        Simulate a single project scenario with random variations.
+        Run the simulation in shards across worker processes.
+
+        Args:
+            workers: Number of worker processes
 
         Returns:
-            Tuple of (total_cost, total_timeline)
+            SimulationResult with the shards concatenated in order
         """
-        total_cost = 0.0
-        total_timeline = 0.0
-
-        # Simulate each task with random variation
-        task_durations = {}
-
-        for task in self.project.tasks:
-            # Random variation based on risk level
-            variation_range = self._get_variation_range()
-
-            # Cost variation (labor rate fluctuation, resource availability)
-            cost_multiplier = random.uniform(
-                1.0 - variation_range * 0.5,
-                1.0 + variation_range
-            )
-            task_cost = task.base_cost * cost_multiplier
-            total_cost += task_cost
-
-            # Timeline variation (delays, unexpected issues, efficiency)
-            time_multiplier = random.uniform(
-                1.0 - variation_range * 0.3,
-                1.0 + variation_range * 1.2
-            )
-            task_duration = task.estimated_days * time_multiplier
-            task_durations[task.task_id] = task_duration
-
-        # Calculate timeline considering dependencies and resources
-        total_timeline = self._calculate_scenario_timeline(task_durations)
+        workers = min(workers, self.iterations)
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(self.iterations), workers)]
+        seeds = np.random.SeedSequence(self.seed).spawn(workers)
 
-        # Add risk-based overhead
-        risk_factor = self._get_risk_factor()
-        total_cost *= risk_factor
-        total_timeline *= risk_factor
+        # Spawn rather than fork: a parent that has already run the parallel
+        # Numba kernel holds threading-layer state that does not survive fork
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            shards = list(executor.map(_simulate_shard, [self.project] * workers, sizes, seeds))
 
-        return total_cost, total_timeline
+        return SimulationResult(
+            costs=np.concatenate([costs for costs, _ in shards]),
+            timelines=np.concatenate([timelines for _, timelines in shards]),
+            iterations=self.iterations
+        )
 
     def _get_variation_range(self) -> float:
         """
@@ -187,12 +353,15 @@ class RiskSimulator:
         }
         return risk_variations.get(self.project.risk_level, 0.30)
 
-    def _get_risk_factor(self) -> float:
+    def _get_risk_factors(self, size: int) -> np.ndarray:
         """
-        Generate a random risk factor for this scenario.
+        Generate a random risk factor for each scenario.
+
+        Args:
+            size: Number of scenarios
 
         Returns:
-            Risk multiplier
+            Array of risk multipliers
         """
         # Base risk multiplier with some randomness
         base_multiplier = {
@@ -202,41 +371,95 @@ class RiskSimulator:
         }.get(self.project.risk_level, 1.15)
 
         # Add random variation (normally distributed around base)
-        variation = random.gauss(0, 0.1)  # Mean 0, std 0.1
-        return max(1.0, base_multiplier + variation)
-
-    def _calculate_scenario_timeline(self, task_durations: Dict[str, float]) -> float:
+        variation = self._rng.standard_normal(size=size, dtype=np.float32)
+        variation *= np.float32(0.1)  # Mean 0, std 0.1
+        variation += np.float32(base_multiplier)
+        return np.maximum(variation, np.float32(1.0), out=variation)
+
+    @cached_property
+    def _critical_path_length(self) -> int:
+        """Number of tasks on the project's critical path."""
+        return len(self.project.get_critical_path())
+
+    @cached_property
+    def _dependency_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate project timeline for a scenario with specific task durations.
+        Topological task order and CSR predecessor arrays, built once.
 
-        Args:
-            task_durations: Dictionary mapping task_id to simulated duration
+        Derived from the project's cached dependency graph, so the simulator
+        schedules exactly the tasks and edges the calculator does: tasks
+        caught in a cycle follow the rest in project order and only keep
+        predecessors placed before them, and a repeated task ID maps to the
+        column of its first task (later ones are left out of the order).
 
         Returns:
-            Total project duration
+            Tuple of (topo, pred_indptr, pred_idx) index arrays, with
+            indices into the project's task columns
         """
-        # Track when each task finishes
-        task_finish_times = {}
+        tasks = self.project.tasks
+        graph = self.project._graph
+        order = graph.schedule_order
+        position = {task_id: pos for pos, task_id in enumerate(order)}
+
+        task_index = {}
+        for i, task in enumerate(tasks):
+            task_index.setdefault(task.task_id, i)
+
+        preds = [[] for _ in tasks]
+        for task_id in order:
+            for succ_id in graph.succ[task_id]:
+                if position[succ_id] > position[task_id]:
+                    preds[task_index[succ_id]].append(task_index[task_id])
+
+        pred_indptr = np.zeros(len(tasks) + 1, dtype=np.int64)
+        np.cumsum([len(task_preds) for task_preds in preds], out=pred_indptr[1:])
+
+        return (
+            np.array([task_index[task_id] for task_id in order], dtype=np.int64),
+            pred_indptr,
+            np.fromiter(chain.from_iterable(preds), dtype=np.int64, count=int(pred_indptr[-1]))
+        )
 
-        # Calculate finish times considering dependencies
-        for task in self.project.tasks:
-            # Earliest this task can start
-            earliest_start = 0.0
-            for dep_id in task.dependencies:
-                if dep_id in task_finish_times:
-                    earliest_start = max(earliest_start, task_finish_times[dep_id])
+    def _calculate_scenario_timelines(self, durations: np.ndarray) -> np.ndarray:
+        """
+        Calculate project timelines for all scenarios at once.
 
-            # Task finishes after its duration
-            task_finish_times[task.task_id] = earliest_start + task_durations[task.task_id]
+        Args:
+            durations: Simulated task durations, shape (iterations, tasks),
+                with columns in project task order
+
+        Returns:
+            Array of total project durations, one per scenario
+        """
+        topo, pred_indptr, pred_idx = self._dependency_arrays
+
+        if NUMBA_AVAILABLE:
+            timelines = cp_batch(durations, topo, pred_indptr, pred_idx)
+        else:
+            # Calculate finish times considering dependencies, one task at a time,
+            # keeping the project finish as a running max as cp_batch does;
+            # plain-int indices avoid NumPy scalar boxing in the Python loop
+            finish_times = np.empty_like(durations)
+            timelines = np.zeros(durations.shape[0], dtype=durations.dtype)
+            indptr = pred_indptr.tolist()
+            for task in topo.tolist():
+                preds = pred_idx[indptr[task]:indptr[task + 1]]
+                finish = finish_times[:, task]
+                finish[:] = durations[:, task]
+                if preds.size:
+                    finish += finish_times[:, preds].max(axis=1)
+                np.maximum(timelines, finish, out=timelines)
 
         # If we have limited resources, add queuing delays
-        if self.project.team_size < self.project.task_count:
+        team_size = self.project.team_size
+        task_count = self.project.task_count
+        if team_size < task_count:
             # Simulate resource contention with random delays
-            contention_factor = 1.0 + (0.1 * (self.project.task_count / self.project.team_size - 1))
-            contention_factor *= random.uniform(0.8, 1.2)  # Add randomness
-            return max(task_finish_times.values()) * contention_factor if task_finish_times else 0.0
+            contention_factor = 1.0 + (0.1 * (task_count / team_size - 1))
+            delays = self._rng.uniform(0.8, 1.2, size=timelines.shape[0]).astype(np.float32)
+            timelines *= np.float32(contention_factor) * delays
 
-        return max(task_finish_times.values()) if task_finish_times else 0.0
+        return timelines
 
     def analyze_risk_drivers(self, result: SimulationResult) -> Dict[str, any]:
         """
@@ -253,39 +476,24 @@ class RiskSimulator:
         timeline_cv = (result.timeline_std / result.timeline_mean) if result.timeline_mean > 0 else 0
 
         # Determine primary risk drivers
-        drivers = []
+        project = self.project
+        cp_len = self._critical_path_length
+        drivers = [
+            message for message, applies in _DRIVER_TABLE
+            if applies(project, cost_cv, timeline_cv, cp_len)
+        ]
 
-        if self.project.risk_level == 'high':
-            drivers.append("High inherent project risk level")
-
-        if self.project.team_size < self.project.task_count / 2:
-            drivers.append("Limited team resources relative to task count")
-
-        if cost_cv > 0.2:
-            drivers.append("High cost variability")
-
-        if timeline_cv > 0.2:
-            drivers.append("High timeline uncertainty")
-
-        # Check for complex dependencies
-        critical_path = self.project.get_critical_path()
-        if len(critical_path) > self.project.task_count * 0.6:
-            drivers.append("Long critical path with many dependencies")
+        costs = result._cost_percentiles
+        timelines = result._timeline_percentiles
 
         return {
             'cost_variability': cost_cv,
             'timeline_variability': timeline_cv,
             'primary_drivers': drivers if drivers else ["Low risk project with stable estimates"],
-            'risk_level': self.project.risk_level,
+            'risk_level': project.risk_level,
             'confidence_80_percent': {
-                'cost_range': (
-                    result.get_cost_percentile(10),
-                    result.get_cost_percentile(90)
-                ),
-                'timeline_range': (
-                    result.get_timeline_percentile(10),
-                    result.get_timeline_percentile(90)
-                )
+                'cost_range': (costs[10], costs[90]),
+                'timeline_range': (timelines[10], timelines[90])
             }
         }
 
@@ -302,46 +510,63 @@ class RiskSimulator:
         scenarios = result.get_scenarios()
         risk_analysis = self.analyze_risk_drivers(result)
 
-        report = []
-        report.append("=" * 70)
-        report.append("MONTE CARLO RISK SIMULATION REPORT")
-        report.append("=" * 70)
-        report.append(f"Project: {self.project.name}")
-        report.append(f"Iterations: {result.iterations:,}")
-        report.append(f"Risk Level: {self.project.risk_level.capitalize()}")
-        report.append("")
-
-        report.append("SCENARIO ANALYSIS:")
-        report.append("-" * 70)
-        for scenario_name, data in scenarios.items():
-            report.append(f"\n{scenario_name.upper().replace('_', ' ')}:")
-            report.append(f"  Cost: ${data['cost']:,.2f}")
-            report.append(f"  Timeline: {data['timeline']:.1f} days")
-            report.append(f"  Note: {data['probability']}")
-
-        report.append("\n" + "=" * 70)
-        report.append("STATISTICAL SUMMARY:")
-        report.append("-" * 70)
-        report.append(f"Cost Mean: ${result.cost_mean:,.2f}")
-        report.append(f"Cost Std Dev: ${result.cost_std:,.2f}")
-        report.append(f"Timeline Mean: {result.timeline_mean:.1f} days")
-        report.append(f"Timeline Std Dev: {result.timeline_std:.1f} days")
-
-        report.append("\n" + "=" * 70)
-        report.append("RISK DRIVERS:")
-        report.append("-" * 70)
-        for driver in risk_analysis['primary_drivers']:
-            report.append(f"  • {driver}")
-
-        report.append(f"\nCost Variability: {risk_analysis['cost_variability']:.1%}")
-        report.append(f"Timeline Variability: {risk_analysis['timeline_variability']:.1%}")
+        scenario_block = "\n".join(
+            f"\n{scenario_name.upper().replace('_', ' ')}:\n"
+            f"  Cost: ${data['cost']:,.2f}\n"
+            f"  Timeline: {data['timeline']:.1f} days\n"
+            f"  Note: {data['probability']}"
+            for scenario_name, data in scenarios.items()
+        )
+        driver_block = "\n".join(f"  • {driver}" for driver in risk_analysis['primary_drivers'])
 
         cost_range = risk_analysis['confidence_80_percent']['cost_range']
         time_range = risk_analysis['confidence_80_percent']['timeline_range']
-        report.append(f"\n80% Confidence Interval:")
-        report.append(f"  Cost: ${cost_range[0]:,.2f} - ${cost_range[1]:,.2f}")
-        report.append(f"  Timeline: {time_range[0]:.1f} - {time_range[1]:.1f} days")
+        rule = "=" * 70
+        divider = "-" * 70
+
+        return (
+            f"{rule}\n"
+            "MONTE CARLO RISK SIMULATION REPORT\n"
+            f"{rule}\n"
+            f"Project: {self.project.name}\n"
+            f"Iterations: {result.iterations:,}\n"
+            f"Risk Level: {self.project.risk_level_display}\n"
+            "\n"
+            "SCENARIO ANALYSIS:\n"
+            f"{divider}\n"
+            f"{scenario_block}\n"
+            f"\n{rule}\n"
+            "STATISTICAL SUMMARY:\n"
+            f"{divider}\n"
+            f"Cost Mean: ${result.cost_mean:,.2f}\n"
+            f"Cost Std Dev: ${result.cost_std:,.2f}\n"
+            f"Timeline Mean: {result.timeline_mean:.1f} days\n"
+            f"Timeline Std Dev: {result.timeline_std:.1f} days\n"
+            f"\n{rule}\n"
+            "RISK DRIVERS:\n"
+            f"{divider}\n"
+            f"{driver_block}\n"
+            f"\nCost Variability: {risk_analysis['cost_variability']:.1%}\n"
+            f"Timeline Variability: {risk_analysis['timeline_variability']:.1%}\n"
+            "\n80% Confidence Interval:\n"
+            f"  Cost: ${cost_range[0]:,.2f} - ${cost_range[1]:,.2f}\n"
+            f"  Timeline: {time_range[0]:.1f} - {time_range[1]:.1f} days\n"
+            f"\n{rule}"
+        )
+
 
-        report.append("\n" + "=" * 70)
+def _simulate_shard(
+        project: Project,
+        iterations: int,
+        seed: np.random.SeedSequence
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate one shard of scenarios in a worker process.
 
-        return "\n".join(report)
\ No newline at end of file
+    Module-level so it pickles. The minimum-iteration clamp applies to the
+    whole run, not to each shard, so it is bypassed here.
+    """
+    simulator = RiskSimulator(project, seed=seed)
+    simulator.iterations = iterations
+    result = simulator.run_simulation()
+    return result.costs, result.timelines
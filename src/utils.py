@@ -111,27 +111,6 @@ def ensure_output_directory(directory: str = "output/reports") -> str:
     return os.path.abspath(directory)
 
 
-def calculate_percentile(values: List[float], percentile: float) -> float:
-    """
-    Calculate a percentile from a list of values.
-
-    Args:
-        values: List of numeric values
-        percentile: Percentile to calculate (0-100)
-
-    Returns:
-        The percentile value
-    """
-    if not values:
-        return 0.0
-
-    sorted_values = sorted(values)
-    index = int(len(sorted_values) * (percentile / 100))
-    index = min(index, len(sorted_values) - 1)
-
-    return sorted_values[index]
-
-
 def print_section_header(title: str, width: int = 60) -> None:
     """
     Print a formatted section header.
@@ -170,7 +149,8 @@ def save_text_report(content: str, filename: str, directory: str = "output/repor
     Returns:
         Full path to the saved file
     """
-    ensure_output_directory(directory)
+    # Only the directory needs to exist; the absolute path is not used here
+    os.makedirs(directory, exist_ok=True)
     filepath = os.path.join(directory, filename)
 
     with open(filepath, 'w', encoding='utf-8') as f:
@@ -2,35 +2,85 @@
 Visualization tools for project analysis results.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Optional
 import os
+import threading
+import numpy as np
 from src.risk_simulator import SimulationResult
 from src.calculator import ProjectCalculator
 from src.project import Project
 from src.utils import ensure_output_directory
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Matplotlib is imported on first use, so callers that never draw a chart
+# do not pay for it; the chart style is applied once per process
+_STYLE_APPLIED = False
+_STYLE_LOCK = threading.Lock()
+
+
+def _apply_style() -> None:
+    """Set the professional-looking chart style the first time a chart is drawn."""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        with _STYLE_LOCK:
+            if not _STYLE_APPLIED:
+                import matplotlib.style
+                matplotlib.style.use('seaborn-v0_8-darkgrid')
+                _STYLE_APPLIED = True
+
 
 class ProjectVisualizer:
     """
     Creates charts and visualizations for project analysis.
     """
 
-    def __init__(self, project: Project, output_dir: str = "output/reports"):
+    def __init__(self, project: Project, output_dir: str = "output/reports", dpi: int = 300):
         """
         Initialize the visualizer.
 
+        Charts are saved at their figure size as laid out by tight_layout,
+        without a second bounding-box pass at save time.
+
         Args:
             project: The project to visualize
             output_dir: Directory to save charts
+            dpi: Resolution of the saved charts; lower it for quick previews
         """
         self.project = project
         self.output_dir = ensure_output_directory(output_dir)
+        self.dpi = dpi
         self.calculator = ProjectCalculator(project)
 
-        # Set style for professional-looking charts
-        plt.style.use('seaborn-v0_8-darkgrid')
+    @staticmethod
+    def _new_figure(**kwargs) -> "Figure":
+        """
+        Create a standalone Agg figure outside pyplot's global state.
+
+        Figures made this way can be drawn from worker threads, since no
+        pyplot figure manager is involved.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _apply_style()
+        fig = Figure(**kwargs)
+        FigureCanvasAgg(fig)
+        return fig
+
+    @staticmethod
+    def _draw_histogram(ax: "Axes", values: np.ndarray, color: str, bins: int = 50) -> None:
+        """
+        Draw a histogram from counts binned with NumPy.
+
+        Only the bin rectangles reach matplotlib, rather than every sample.
+        """
+        counts, edges = np.histogram(values, bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               color=color, edgecolor='black', alpha=0.7)
 
     def create_cost_breakdown_chart(self, filename: str = "cost_breakdown.png") -> str:
         """
@@ -47,10 +97,12 @@ class ProjectVisualizer:
         # Prepare data
         labels = [tc['task_name'] for tc in task_costs]
         sizes = [tc['adjusted_cost'] for tc in task_costs]
-        colors = plt.cm.Set3(range(len(labels)))
+        from matplotlib import colormaps
+        colors = colormaps['Set3'](range(len(labels)))
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = self._new_figure(figsize=(10, 8))
+        ax = fig.subplots()
 
         # Create pie chart
         wedges, texts, autotexts = ax.pie(
@@ -76,12 +128,11 @@ class ProjectVisualizer:
             pad=20
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=self.dpi)
 
         return filepath
 
@@ -107,7 +158,8 @@ class ProjectVisualizer:
         colors = ['#ff6b6b', '#4ecdc4', '#45b7d1']
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._new_figure(figsize=(10, 6))
+        ax = fig.subplots()
 
         # Create bars
         bars = ax.bar(scenarios, durations, color=colors, edgecolor='black', linewidth=1.5)
@@ -135,19 +187,19 @@ class ProjectVisualizer:
         )
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=self.dpi)
 
         return filepath
 
     def create_risk_distribution_chart(
             self,
             simulation_result: SimulationResult,
-            filename: str = "risk_distribution.png"
+            filename: str = "risk_distribution.png",
+            stats: Optional[Dict[str, float]] = None
     ) -> str:
         """
         Create histograms showing cost and timeline distributions.
@@ -155,23 +207,22 @@ class ProjectVisualizer:
         Args:
             simulation_result: Results from Monte Carlo simulation
             filename: Name for the output file
+            stats: Precomputed simulation_result.compute_all_stats()
 
         Returns:
             Full path to saved chart
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        if stats is None:
+            stats = simulation_result.compute_all_stats()
+
+        fig = self._new_figure(figsize=(14, 6))
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Cost distribution
-        ax1.hist(
-            simulation_result.costs,
-            bins=50,
-            color='#45b7d1',
-            edgecolor='black',
-            alpha=0.7
-        )
+        self._draw_histogram(ax1, simulation_result.costs, '#45b7d1')
 
         # Add mean line
-        mean_cost = simulation_result.cost_mean
+        mean_cost = stats['cost_mean']
         ax1.axvline(
             mean_cost,
             color='red',
@@ -181,8 +232,8 @@ class ProjectVisualizer:
         )
 
         # Add percentile lines
-        p10 = simulation_result.get_cost_percentile(10)
-        p90 = simulation_result.get_cost_percentile(90)
+        p10 = stats['cost_p10']
+        p90 = stats['cost_p90']
         ax1.axvline(p10, color='green', linestyle=':', linewidth=2, label=f'P10: ${p10:,.0f}')
         ax1.axvline(p90, color='orange', linestyle=':', linewidth=2, label=f'P90: ${p90:,.0f}')
 
@@ -193,16 +244,10 @@ class ProjectVisualizer:
         ax1.grid(alpha=0.3)
 
         # Timeline distribution
-        ax2.hist(
-            simulation_result.timelines,
-            bins=50,
-            color='#f39c12',
-            edgecolor='black',
-            alpha=0.7
-        )
+        self._draw_histogram(ax2, simulation_result.timelines, '#f39c12')
 
         # Add mean line
-        mean_timeline = simulation_result.timeline_mean
+        mean_timeline = stats['timeline_mean']
         ax2.axvline(
             mean_timeline,
             color='red',
@@ -212,8 +257,8 @@ class ProjectVisualizer:
         )
 
         # Add percentile lines
-        t10 = simulation_result.get_timeline_percentile(10)
-        t90 = simulation_result.get_timeline_percentile(90)
+        t10 = stats['timeline_p10']
+        t90 = stats['timeline_p90']
         ax2.axvline(t10, color='green', linestyle=':', linewidth=2, label=f'P10: {t10:.1f} days')
         ax2.axvline(t90, color='orange', linestyle=':', linewidth=2, label=f'P90: {t90:.1f} days')
 
@@ -227,23 +272,22 @@ class ProjectVisualizer:
         fig.suptitle(
             f'Monte Carlo Risk Analysis - {self.project.name}\n{simulation_result.iterations:,} Simulations',
             fontsize=14,
-            fontweight='bold',
-            y=1.02
+            fontweight='bold'
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=self.dpi)
 
         return filepath
 
     def create_scenario_comparison_chart(
             self,
             simulation_result: SimulationResult,
-            filename: str = "scenario_comparison.png"
+            filename: str = "scenario_comparison.png",
+            stats: Optional[Dict[str, float]] = None
     ) -> str:
         """
         Create a chart comparing best, expected, and worst case scenarios.
@@ -251,21 +295,24 @@ class ProjectVisualizer:
         Args:
             simulation_result: Results from Monte Carlo simulation
             filename: Name for the output file
+            stats: Precomputed simulation_result.compute_all_stats()
 
         Returns:
             Full path to saved chart
         """
-        scenarios = simulation_result.get_scenarios()
+        if stats is None:
+            stats = simulation_result.compute_all_stats()
 
         # Prepare data
         scenario_names = ['Best Case\n(P10)', 'Expected\n(Mean)', 'P75', 'Worst Case\n(P90)']
-        scenario_keys = ['best_case', 'expected', 'p75', 'worst_case']
+        stat_suffixes = ['p10', 'mean', 'p75', 'p90']
 
-        costs = [scenarios[key]['cost'] for key in scenario_keys]
-        timelines = [scenarios[key]['timeline'] for key in scenario_keys]
+        costs = [stats[f'cost_{suffix}'] for suffix in stat_suffixes]
+        timelines = [stats[f'timeline_{suffix}'] for suffix in stat_suffixes]
 
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig = self._new_figure(figsize=(14, 6))
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Cost comparison
         colors_cost = ['#2ecc71', '#3498db', '#f39c12', '#e74c3c']
@@ -313,16 +360,14 @@ class ProjectVisualizer:
         fig.suptitle(
             f'Scenario Comparison - {self.project.name}',
             fontsize=14,
-            fontweight='bold',
-            y=1.02
+            fontweight='bold'
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=self.dpi)
 
         return filepath
 
@@ -346,7 +391,8 @@ class ProjectVisualizer:
         durations = [task.estimated_days for task in critical_path]
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, max(6, len(critical_path) * 0.5)))
+        fig = self._new_figure(figsize=(10, max(6, len(critical_path) * 0.5)))
+        ax = fig.subplots()
 
         # Create horizontal bars
         y_pos = range(len(task_names))
@@ -369,6 +415,7 @@ class ProjectVisualizer:
         ax.set_yticks(y_pos)
         ax.set_yticklabels(task_names)
         ax.set_xlabel('Duration (days)', fontsize=12, fontweight='bold')
+        ax.set_xlim(0, max(durations) * 1.15)  # Room for the labels past the longest bar
         ax.set_title(
             f'Critical Path Tasks - {self.project.name}\nTotal Duration: {sum(durations):.1f} days',
             fontsize=14,
@@ -377,12 +424,11 @@ class ProjectVisualizer:
         )
         ax.grid(axis='x', alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filepath, dpi=self.dpi)
 
         return filepath
 
@@ -396,28 +442,32 @@ class ProjectVisualizer:
         Returns:
             Dictionary mapping chart names to file paths
         """
-        charts = {}
-
         print("Generating visualizations...")
 
-        # Always generate these
-        charts['cost_breakdown'] = self.create_cost_breakdown_chart()
-        print("  ✓ Cost breakdown chart created")
-
-        charts['timeline_comparison'] = self.create_timeline_comparison_chart()
-        print("  ✓ Timeline comparison chart created")
-
-        charts['critical_path'] = self.create_critical_path_chart()
-        if charts['critical_path']:
-            print("  ✓ Critical path chart created")
+        # Each chart draws its own Agg figure, so they render in parallel
+        jobs = {
+            'cost_breakdown': (self.create_cost_breakdown_chart, "Cost breakdown"),
+            'timeline_comparison': (self.create_timeline_comparison_chart, "Timeline comparison"),
+            'critical_path': (self.create_critical_path_chart, "Critical path"),
+        }
 
         # Generate simulation charts if result provided
         if simulation_result:
-            charts['risk_distribution'] = self.create_risk_distribution_chart(simulation_result)
-            print("  ✓ Risk distribution chart created")
+            stats = simulation_result.compute_all_stats()
+            jobs['risk_distribution'] = (
+                lambda: self.create_risk_distribution_chart(simulation_result, stats=stats), "Risk distribution"
+            )
+            jobs['scenario_comparison'] = (
+                lambda: self.create_scenario_comparison_chart(simulation_result, stats=stats), "Scenario comparison"
+            )
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(func) for name, (func, _) in jobs.items()}
+            charts = {name: future.result() for name, future in futures.items()}
 
-            charts['scenario_comparison'] = self.create_scenario_comparison_chart(simulation_result)
-            print("  ✓ Scenario comparison chart created")
+        for name, (_, label) in jobs.items():
+            if charts[name]:
+                print(f"  ✓ {label} chart created")
 
         print(f"\nAll charts saved to: {self.output_dir}\n")
 
@@ -136,6 +136,32 @@ class TestProjectCalculator:
         # Verify math
         assert breakdown['total_cost'] == breakdown['base_cost'] + breakdown['risk_overhead']
 
+    def test_cost_breakdown_cached_until_refresh(self, simple_project):
+        """Test the cost breakdown is computed once and rebuilt by refresh."""
+        calculator = ProjectCalculator(simple_project)
+        first = calculator.cost_breakdown
+        assert calculator.cost_breakdown is first
+        assert calculator.calculate_cost_breakdown() == first
+        assert calculator.calculate_cost_breakdown() is not first
+
+        simple_project.tasks.append(Task(name="Extra", estimated_days=1, cost_per_day=100, task_id="extra"))
+        calculator.refresh()
+        assert calculator.cost_breakdown['base_cost'] == first['base_cost'] + 100
+
+    def test_task_edits_picked_up_by_refresh(self):
+        """Test that editing a task in place and refreshing updates every cost view."""
+        tasks = [
+            Task(name="Design", estimated_days=5, cost_per_day=100, task_id="design"),
+            Task(name="Build", estimated_days=3, cost_per_day=100, task_id="build", dependencies=["design"]),
+        ]
+        calculator = ProjectCalculator(Project(name="Chain", tasks=tasks, team_size=1, risk_level="low"))
+        assert calculator.get_critical_path_analysis()['cost'] == 800
+
+        tasks[0].estimated_days = 10
+        calculator.refresh()
+        assert calculator.calculate_base_cost() == 1300
+        assert calculator.get_critical_path_analysis()['cost'] == 1300
+
     def test_timeline_breakdown_structure(self, simple_project):
         """Test timeline breakdown returns correct structure."""
         calculator = ProjectCalculator(simple_project)
@@ -160,6 +186,16 @@ class TestProjectCalculator:
         assert task_costs[0]['base_cost'] == 5 * 1000
         assert task_costs[0]['adjusted_cost'] == 5 * 1000 * 1.3  # Medium risk
 
+    def test_calculate_task_costs_frame(self, simple_project):
+        """Test the columnar task cost table matches the per-task dicts."""
+        calculator = ProjectCalculator(simple_project)
+        frame = calculator.calculate_task_costs_frame()
+        task_costs = calculator.calculate_task_costs()
+
+        assert list(frame['task_name']) == [tc['task_name'] for tc in task_costs]
+        assert list(frame['base_cost']) == [tc['base_cost'] for tc in task_costs]
+        assert list(frame['adjusted_cost']) == [tc['adjusted_cost'] for tc in task_costs]
+
     def test_critical_path_analysis(self, project_with_dependencies):
         """Test critical path analysis."""
         calculator = ProjectCalculator(project_with_dependencies)
@@ -226,6 +262,34 @@ class TestProjectCalculator:
         sequential = 5 * 5 * 1.1  # 5 tasks * 5 days * 1.1 = 27.5
         assert timeline <= sequential
 
+    def test_resource_constrained_schedule_respects_team_size(self):
+        """Test that no more tasks run at once than there are team members."""
+        tasks = [
+            Task(name=f"Task{i}", estimated_days=5, cost_per_day=1000)
+            for i in range(5)
+        ]
+        project = Project(name="Constrained", tasks=tasks, team_size=2, risk_level="low")
+        calculator = ProjectCalculator(project)
+
+        # Three waves of 5-day tasks: 2 + 2 + 1
+        assert calculator._simulate_resource_constrained_schedule() == 15
+
+    def test_resource_constrained_schedule_with_dependencies(self):
+        """Test that freed team members pick up tasks as dependencies finish."""
+        tasks = [
+            Task(name="Design", estimated_days=2, cost_per_day=1000, task_id="design"),
+            Task(name="Backend", estimated_days=4, cost_per_day=1000,
+                 task_id="backend", dependencies=["design"]),
+            Task(name="Frontend", estimated_days=3, cost_per_day=1000,
+                 task_id="frontend", dependencies=["design"]),
+            Task(name="Docs", estimated_days=6, cost_per_day=1000, task_id="docs"),
+        ]
+        project = Project(name="Constrained", tasks=tasks, team_size=2, risk_level="low")
+        calculator = ProjectCalculator(project)
+
+        # Docs and Design start at 0; Backend starts at 2, Frontend at 6
+        assert calculator._simulate_resource_constrained_schedule() == 9
+
 
 
 class TestTaskModel:
@@ -262,6 +326,7 @@ class TestProjectModel:
         assert project.name == "Test"
         assert project.team_size == 3
         assert project.risk_level == "low"
+        assert project.risk_level_display == "Low"
         assert project.task_count == 1
 
     def test_invalid_team_size(self):
@@ -292,6 +357,17 @@ class TestProjectModel:
 
         assert project.get_task_by_id("nonexistent") is None
 
+    def test_get_task_by_name(self):
+        """Test finding task by name, ignoring case."""
+        tasks = [
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="t1"),
+            Task(name="design", estimated_days=3, cost_per_day=800, task_id="t2"),
+        ]
+        project = Project(name="Test", tasks=tasks, team_size=2, risk_level="medium")
+
+        assert project.get_task_by_name("DESIGN") is tasks[0]
+        assert project.get_task_by_name("nonexistent") is None
+
     def test_validate_dependencies(self):
         """Test dependency validation."""
         tasks = [
@@ -305,6 +381,20 @@ class TestProjectModel:
         assert len(errors) > 0
         assert "non-existent" in errors[0].lower()
 
+    def test_validate_dependencies_reports_missing_before_cycles(self):
+        """Test missing dependencies are reported without a cycle check."""
+        tasks = [
+            Task(name="Task1", estimated_days=5, cost_per_day=1000, task_id="t1",
+                 dependencies=["t2"]),
+            Task(name="Task2", estimated_days=3, cost_per_day=800, task_id="t2",
+                 dependencies=["t1", "ghost"]),
+        ]
+        project = Project(name="Test", tasks=tasks, team_size=2, risk_level="medium")
+
+        assert project.validate_dependencies() == [
+            "Task 'Task2' depends on non-existent task 'ghost'"
+        ]
+
     def test_circular_dependency_detection(self):
         """Test circular dependency detection."""
         tasks = [
@@ -319,6 +409,22 @@ class TestProjectModel:
         assert len(errors) > 0
         assert "circular" in errors[0].lower()
 
+    def test_circular_dependency_detection_long_chain(self):
+        """Test cycle detection on a chain deeper than Python's recursion limit."""
+        n_tasks = 5000
+        tasks = [Task(name="Task0", estimated_days=1, cost_per_day=100, task_id="t0")]
+        tasks += [
+            Task(name=f"Task{i}", estimated_days=1, cost_per_day=100, task_id=f"t{i}",
+                 dependencies=[f"t{i - 1}"])
+            for i in range(1, n_tasks)
+        ]
+        project = Project(name="Chain", tasks=tasks, team_size=2, risk_level="low")
+
+        assert not project._has_circular_dependency()
+
+        tasks[0].dependencies.append(f"t{n_tasks - 1}")
+        assert project._has_circular_dependency()
+
     def test_get_independent_tasks(self):
         """Test getting tasks without dependencies."""
         tasks = [
@@ -331,4 +437,105 @@ class TestProjectModel:
 
         independent = project.get_independent_tasks()
         assert len(independent) == 2
-        assert all(not task.has_dependencies() for task in independent)
\ No newline at end of file
+        assert all(not task.has_dependencies() for task in independent)
+
+    def test_critical_path_diamond(self):
+        """Test critical path picks the longer branch of a diamond, whatever the task order."""
+        tasks = [
+            Task(name="Launch", estimated_days=1, cost_per_day=500, task_id="launch",
+                 dependencies=["backend", "frontend"]),
+            Task(name="Backend", estimated_days=8, cost_per_day=1000, task_id="backend",
+                 dependencies=["spec"]),
+            Task(name="Frontend", estimated_days=4, cost_per_day=1000, task_id="frontend",
+                 dependencies=["spec"]),
+            Task(name="Spec", estimated_days=2, cost_per_day=800, task_id="spec"),
+        ]
+        project = Project(name="Diamond", tasks=tasks, team_size=2, risk_level="low")
+
+        path = [task.task_id for task in project.get_critical_path()]
+        assert path == ["spec", "backend", "launch"]
+
+    def test_critical_path_refreshes_after_invalidate(self):
+        """Test cached graph data is rebuilt after invalidate_cache."""
+        tasks = [
+            Task(name="Task1", estimated_days=5, cost_per_day=1000, task_id="t1"),
+            Task(name="Task2", estimated_days=3, cost_per_day=800, task_id="t2"),
+        ]
+        project = Project(name="Test", tasks=tasks, team_size=2, risk_level="medium")
+        assert [t.task_id for t in project.get_critical_path()] == ["t1"]
+
+        tasks[1].dependencies = ["t1"]
+        project.invalidate_cache()
+        assert [t.task_id for t in project.get_critical_path()] == ["t1", "t2"]
+
+    def test_totals_refresh_after_invalidate(self):
+        """Test cached project totals are recomputed after invalidate_cache."""
+        tasks = [
+            Task(name="Task1", estimated_days=5, cost_per_day=1000, task_id="t1"),
+            Task(name="Task2", estimated_days=3, cost_per_day=800, task_id="t2"),
+        ]
+        project = Project(name="Test", tasks=tasks, team_size=2, risk_level="medium")
+        assert project.total_base_cost == 7400
+        assert project.task_count == 2
+
+        project.tasks.append(Task(name="Task3", estimated_days=2, cost_per_day=500, task_id="t3"))
+        project.invalidate_cache()
+        assert project.total_base_cost == 8400
+        assert project.total_estimated_days == 10
+        assert project.task_count == 3
+
+    def test_dependency_graph_ignores_task_order(self):
+        """Test earliest starts follow dependencies even when tasks are listed out of order."""
+        tasks = [
+            Task(name="Testing", estimated_days=3, cost_per_day=800,
+                 task_id="test", dependencies=["dev"]),
+            Task(name="Development", estimated_days=10, cost_per_day=1500,
+                 task_id="dev", dependencies=["design"]),
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+        ]
+        project = Project(name="Unordered", tasks=tasks, team_size=3, risk_level="low")
+        graph = project._graph
+
+        assert graph.topo_order == ("design", "dev", "test")
+        assert graph.id_to_task["dev"] is tasks[1]
+        assert graph.earliest_start == {"design": 0.0, "dev": 5.0, "test": 15.0}
+        assert graph.critical_path_ids == ("design", "dev", "test")
+
+    def test_dependency_graph_uses_first_of_duplicate_ids(self):
+        """Test that only the first task sharing an ID contributes edges to the graph."""
+        tasks = [
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+            Task(name="Development", estimated_days=10, cost_per_day=1500,
+                 task_id="dev", dependencies=["design"]),
+            Task(name="Dev Copy", estimated_days=2, cost_per_day=100,
+                 task_id="dev", dependencies=["test"]),
+            Task(name="Testing", estimated_days=3, cost_per_day=800,
+                 task_id="test", dependencies=["dev"]),
+        ]
+        project = Project(name="Duplicates", tasks=tasks, team_size=1, risk_level="low")
+        graph = project._graph
+
+        assert graph.topo_order == ("design", "dev", "test")
+        assert graph.indeg == {"design": 0, "dev": 1, "test": 1}
+        assert graph.succ == {"design": ("dev",), "dev": ("test",), "test": ()}
+        assert ProjectCalculator(project)._simulate_resource_constrained_schedule() == 18.0
+
+    def test_topological_tasks_put_cycles_last(self):
+        """Test topological order lists dependencies first and cycle tasks at the end."""
+        tasks = [
+            Task(name="Loop A", estimated_days=1, cost_per_day=100,
+                 task_id="a", dependencies=["b"]),
+            Task(name="Testing", estimated_days=3, cost_per_day=800,
+                 task_id="test", dependencies=["design"]),
+            Task(name="Loop B", estimated_days=1, cost_per_day=100,
+                 task_id="b", dependencies=["a"]),
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+        ]
+        project = Project(name="Cyclic", tasks=tasks, team_size=1, risk_level="low")
+
+        assert [task.task_id for task in project.topological_tasks] == ["design", "test", "a", "b"]
+
+        # Removing "a" breaks the cycle; a dependency on an unknown task is ignored
+        project.tasks.pop(0)
+        project.invalidate_cache()
+        assert [task.task_id for task in project.topological_tasks] == ["b", "design", "test"]
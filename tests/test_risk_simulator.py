@@ -0,0 +1,132 @@
+"""
+Unit tests for the RiskSimulator class.
+"""
+
+import numpy as np
+import pytest
+from src.project import Project, Task
+from src.risk_simulator import RiskSimulator
+
+
+class TestRiskSimulator:
+    """Test cases for RiskSimulator."""
+
+    @pytest.fixture
+    def project(self):
+        """Create a project with a dependency chain and limited resources."""
+        tasks = [
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+            Task(name="Development", estimated_days=10, cost_per_day=1500,
+                 task_id="dev", dependencies=["design"]),
+            Task(name="Testing", estimated_days=3, cost_per_day=800,
+                 task_id="test", dependencies=["dev"]),
+            Task(name="Docs", estimated_days=4, cost_per_day=500, task_id="docs"),
+        ]
+        return Project(name="Sim Project", tasks=tasks, team_size=2, risk_level="medium")
+
+    def test_same_seed_is_reproducible(self, project):
+        """Test that a fixed seed reproduces identical results."""
+        first = RiskSimulator(project, iterations=200, seed=7).run_simulation()
+        second = RiskSimulator(project, iterations=200, seed=7).run_simulation()
+
+        assert list(first.costs) == list(second.costs)
+        assert list(first.timelines) == list(second.timelines)
+
+    def test_minimum_iterations(self, project):
+        """Test that iterations are clamped to the minimum of 100."""
+        result = RiskSimulator(project, iterations=10, seed=1).run_simulation()
+
+        assert result.iterations == 100
+        assert len(result.costs) == 100
+        assert len(result.timelines) == 100
+
+    def test_costs_within_model_bounds(self, project):
+        """Test simulated costs stay within the variation model's bounds."""
+        result = RiskSimulator(project, iterations=500, seed=3).run_simulation()
+        base = project.total_base_cost
+
+        # Medium risk: cost multiplier in [0.85, 1.30], risk factor >= 1.0
+        assert min(result.costs) >= base * 0.85
+        assert result.cost_mean > base
+
+    def test_scenarios_are_ordered(self, project):
+        """Test that percentile scenarios are monotonic."""
+        scenarios = RiskSimulator(project, iterations=500, seed=11).run_simulation().get_scenarios()
+
+        assert scenarios['best_case']['cost'] <= scenarios['p50']['cost']
+        assert scenarios['p50']['cost'] <= scenarios['p75']['cost']
+        assert scenarios['p75']['cost'] <= scenarios['worst_case']['cost']
+        assert scenarios['best_case']['timeline'] <= scenarios['worst_case']['timeline']
+
+    def test_scenario_timelines_follow_dependencies(self):
+        """Test timelines use the longest dependency chain, whatever the task order."""
+        tasks = [
+            Task(name="Testing", estimated_days=3, cost_per_day=800,
+                 task_id="test", dependencies=["dev"]),
+            Task(name="Development", estimated_days=10, cost_per_day=1500,
+                 task_id="dev", dependencies=["design"]),
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+            Task(name="Docs", estimated_days=4, cost_per_day=500, task_id="docs"),
+        ]
+        project = Project(name="Unordered", tasks=tasks, team_size=4, risk_level="low")
+        simulator = RiskSimulator(project, seed=0)
+
+        durations = np.array([
+            [3.0, 10.0, 5.0, 4.0],
+            [1.0, 2.0, 1.0, 9.0],
+        ])
+        timelines = simulator._calculate_scenario_timelines(durations)
+
+        assert list(timelines) == [18.0, 9.0]
+
+    def test_scenario_timelines_use_first_of_duplicate_ids(self):
+        """Test a repeated task ID is scheduled as its first task, as the calculator does."""
+        tasks = [
+            Task(name="Design", estimated_days=5, cost_per_day=1000, task_id="design"),
+            Task(name="Development", estimated_days=10, cost_per_day=1500,
+                 task_id="dev", dependencies=["design"]),
+            Task(name="Dev Copy", estimated_days=30, cost_per_day=100, task_id="dev"),
+        ]
+        project = Project(name="Duplicates", tasks=tasks, team_size=3, risk_level="low")
+        simulator = RiskSimulator(project, seed=0)
+
+        timelines = simulator._calculate_scenario_timelines(np.array([[5.0, 10.0, 30.0]]))
+
+        assert list(timelines) == [15.0]
+
+    def test_percentiles_match_numpy(self, project):
+        """Test percentile lookups on the cached sorted arrays match np.percentile."""
+        result = RiskSimulator(project, iterations=501, seed=5).run_simulation()
+
+        for p in (0, 10, 37.5, 50, 90, 100):
+            assert result.get_cost_percentile(p) == pytest.approx(
+                float(np.percentile(result.costs, p)), rel=1e-6)
+            assert result.get_timeline_percentile(p) == pytest.approx(
+                float(np.percentile(result.timelines, p)), rel=1e-6)
+
+        with pytest.raises(ValueError):
+            result.get_cost_percentile(101)
+        with pytest.raises(ValueError):
+            result.get_timeline_percentile(-1)
+
+    def test_sharded_run_is_reproducible(self, project):
+        """Test that a seeded multi-process run is reproducible and keeps the iteration count."""
+        first = RiskSimulator(project, iterations=301, seed=7).run_simulation(workers=2)
+        second = RiskSimulator(project, iterations=301, seed=7).run_simulation(workers=2)
+
+        assert first.iterations == 301
+        assert len(first.costs) == 301
+        assert len(first.timelines) == 301
+        assert list(first.costs) == list(second.costs)
+        assert list(first.timelines) == list(second.timelines)
+
+    def test_compute_all_stats_matches_scenarios(self, project):
+        """Test the precomputed stats agree with the scenario table."""
+        result = RiskSimulator(project, iterations=300, seed=2).run_simulation()
+        stats = result.compute_all_stats()
+        scenarios = result.get_scenarios()
+
+        assert stats['cost_p10'] == scenarios['best_case']['cost']
+        assert stats['cost_p90'] == scenarios['worst_case']['cost']
+        assert stats['timeline_p75'] == scenarios['p75']['timeline']
+        assert stats['cost_mean'] == result.cost_mean